@@ -12,6 +12,7 @@ _CONFIG_EXISTS: bool = _CONFIG_PATH.exists()
 _PARSER = RawConfigParser()
 _PARSER.optionxform = str  # Preserve case when writing
 _RUN_FROM_EXE: bool = getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS")
+_PARSED: dict[tuple, Any] = {}  # Numeric settings keyed by (section, option, type)
 
 # Temporary variables that are read and updated between multiple modules
 _SESSION: dict[str, Any] = {
@@ -185,6 +186,7 @@ def save_config() -> None:
 
 def set_defaults(version: str = "") -> None:
     """Restore all of the predefined settings and values for the config file."""
+    _PARSED.clear()
     for key in DEFAULTS.keys():
         _PARSER[key] = DEFAULTS[key]
 
@@ -200,6 +202,22 @@ def default_value(section: str, option: str) -> bool:
     return _PARSER.get(section, option) == DEFAULTS[section][option]
 
 
+def setting_int(section: str, option: str) -> int:
+    """Return a config value parsed as an integer, caching the result until the value changes."""
+    key: tuple = (section, option, int)
+    if key not in _PARSED:
+        _PARSED[key] = int(setting(section, option))
+    return _PARSED[key]
+
+
+def setting_float(section: str, option: str) -> float:
+    """Return a config value parsed as a float, caching the result until the value changes."""
+    key: tuple = (section, option, float)
+    if key not in _PARSED:
+        _PARSED[key] = float(setting(section, option))
+    return _PARSED[key]
+
+
 def setting_bool(section: str, option: str, **kwargs) -> bool:
     """Return the string comparison result for a config value."""
     return setting(section, option, **kwargs) == "True"
@@ -253,6 +271,9 @@ def set_value(section: str, option: str, new_value: Any) -> None:
     if new_value == _PARSER.get(section, option, fallback=DEFAULTS):
         return
 
+    _PARSED.pop((section, option, int), None)
+    _PARSED.pop((section, option, float), None)
+
     try:
         if "." not in new_value:
             return
@@ -2,10 +2,13 @@
 
 from gc import get_referents
 from inspect import getmembers, isfunction, signature, stack
+from pathlib import Path
 from pprint import pformat
+from subprocess import run
 from sys import getsizeof
 from typing import Any, Callable
 
+from core.configuration import app_root
 from core.logger import get_logger
 from core.utilities import size_from_bytes
 
@@ -70,3 +73,21 @@ def get_function_members(func: Callable) -> None:
 def get_function_signature(func: Callable) -> None:
     """Print the signature of a function."""
     logger.debug(pformat(f"{func.__qualname__} signature: {signature(func)}"))
+
+
+def compile_ui_layouts(force: bool = False) -> None:
+    """Regenerate the Python layout modules from their Qt Designer (.ui) sources.
+
+    Layouts are compiled ahead of time with pyuic6 so the application never parses XML at launch.
+    Only layouts whose .ui source is newer than the generated module are compiled unless forced.
+    """
+    for ui_file in (Path(app_root()) / "gui" / "layouts").glob("*.ui"):
+        py_file: Path = ui_file.with_suffix(".py")
+        if not force and py_file.exists() and py_file.stat().st_mtime >= ui_file.stat().st_mtime:
+            continue
+
+        result = run(["pyuic6", str(ui_file), "-o", str(py_file)], capture_output=True, text=True)
+        if result.returncode:
+            logger.error(f"Failed to compile {ui_file.name}: {result.stderr.strip()}")
+        else:
+            logger.debug(f"Compiled {ui_file.name} -> {py_file.name}")
@@ -3,8 +3,9 @@
 from collections import namedtuple
 from pathlib import Path
 from re import compile, search
-from urllib.error import HTTPError, URLError
-from urllib.request import urlopen
+
+from PyQt6.QtCore import QUrl
+from PyQt6.QtNetwork import QNetworkRequest
 
 from core.configuration import app_root, running_from_exe, session, set_value, setting, setting_bool
 from core.logger import get_logger, log_chapter, log_exception
@@ -17,15 +18,23 @@ _RAW_FILE_URL: str = "https://raw.githubusercontent.com/Dolikhena/Pydra-External
 _TIMEOUT: int = int(setting("Development", "UpdateTimeout"))
 
 
-def update_available() -> tuple[bool, bool]:
-    """Check the current build version against GitHub and return True if an update is available."""
+def update_available(remote_version_file: str) -> tuple[bool, bool]:
+    """Check the current build version against GitHub and return True if an update is available.
+
+    Args:
+        * remote_version_file (str): Contents of the latest version resource file, downloaded
+        with `version_file_request()`. An empty string indicates the download failed.
+    """
     newer_build_available: bool = False
     config_out_of_date: bool = False
 
     try:
         logger.debug(f"Version: {current_version_str()}, build {_CURRENT.build}")
         config_out_of_date = compare_config_version()
-        latest = latest_version()
+        if remote_version_file:
+            latest = parse_version_file(remote_version_file)
+        else:
+            latest = Version(0, 0, 0, 0)
 
         if running_from_exe():
             new_major: bool = latest.major > _CURRENT.major
@@ -49,19 +58,11 @@ def update_available() -> tuple[bool, bool]:
         return (newer_build_available, config_out_of_date)
 
 
-def latest_version() -> Version[int, int, int, int]:
-    """Return the latest version, obtained from a raw GitHub file."""
-    version_str: tuple[int, int, int, int] = (0, 0, 0, 0)
-    try:
-        with urlopen(_RAW_FILE_URL, timeout=_TIMEOUT) as response:
-            data = response.read().decode("utf-8")
-            version_str = parse_version_file(data)
-    except (HTTPError, URLError) as e:
-        logger.error(f"Could not establish connection to GitHub: {e}")
-    except Exception as e:
-        log_exception(logger, e)
-    finally:
-        return Version(version_str[0], version_str[1], version_str[2], version_str[3])
+def version_file_request() -> QNetworkRequest:
+    """Return a network request for the latest version resource file."""
+    request = QNetworkRequest(QUrl(_RAW_FILE_URL))
+    request.setTransferTimeout(_TIMEOUT * 1000)
+    return request
 
 
 def current_version() -> Version[int, int, int, int]:
@@ -18,6 +18,7 @@ from numpy import (
     any,
     array,
     average,
+    count_nonzero,
     float32,
     int8,
     int16,
@@ -36,7 +37,6 @@ from numpy import (
     uint8,
     uint16,
     uint32,
-    where,
     zeros,
 )
 from pandas import DataFrame, Series, to_datetime
@@ -89,6 +89,7 @@ class CaptureFile(ABC):
         "app_name",
         "callback",
         "data",
+        "data_version",
         "duplicate_headers",
         "fallbacks_in_use",
         "hash",
@@ -112,6 +113,7 @@ class CaptureFile(ABC):
         self.app_name: str = "Unknown"
         self.callback: Callable
         self.data: Optional[DataFrame] = None
+        self.data_version: int = 0  # Incremented whenever data is modified in place
         self.duplicate_headers: Optional[list] = None
         self.fallbacks_in_use: Optional[dict] = {}
         self.headers: Optional[list] = None
@@ -384,24 +386,25 @@ class CaptureFile(ABC):
             delta_ms: float = float(setting("StutterHeuristic", "StutterDeltaMs"))
             delta_pct: float = float(setting("StutterHeuristic", "StutterDeltaPct")) / 100
 
-            # Calculate rolling median (default: 19 frames)
-            rolling_median: Series = rolling_frametimes.median()
+            # Calculate rolling median (default: 19 frames). The remaining steps work on plain
+            # arrays to skip index alignment and the copies made by converting each Series.
+            rolling_median: ndarray = rolling_frametimes.median().to_numpy()
 
-            frame_time_deviations: ndarray = abs(frametimes - rolling_median)
-            percent_deviations: ndarray = array(frame_time_deviations / rolling_median)
+            frame_time_deviations: ndarray = abs(frametimes.to_numpy() - rolling_median)
+            percent_deviations: ndarray = frame_time_deviations / rolling_median
 
             # Test if delta between frame time and median exceeds threshold (default: 20%)
-            percent_delta: ndarray = array(percent_deviations > delta_pct)
+            percent_delta: ndarray = percent_deviations > delta_pct
 
             # Test if each frame time delta is also greater than threshold (default: 4 ms)
-            ms_delta: ndarray = array(frame_time_deviations > delta_ms)
+            ms_delta: ndarray = frame_time_deviations > delta_ms
 
             # Consider as stutter event if the two above conditions are true
-            stutter_frames: ndarray = array(percent_delta & ms_delta, dtype=uint8)
-            stutter_deltas: ndarray = percent_deviations[where(stutter_frames == 1)]
+            stutter_frames: ndarray = percent_delta & ms_delta
+            stutter_deltas: ndarray = percent_deviations[stutter_frames]
 
             # Calculate statistics on stutter data
-            num_stutter_frames: int = sum(stutter_frames)
+            num_stutter_frames: int = count_nonzero(stutter_frames)
             pct_stutter_frames: float = 0
             avg_stutter_delta: float = 0
             max_stutter_delta: float = 0
@@ -716,6 +719,7 @@ class CaptureFile(ABC):
         time_alias: str = self.header_by_alias("Elapsed Time")
         initial_timestamp = self.column(time_alias, index=self.offset)
         self.data[time_alias] = round(self.data[time_alias] - initial_timestamp, 9)
+        self.data_version += 1
 
         first_timestamp: float = self.column(time_alias, index=0)
         if first_timestamp != 0:
@@ -745,6 +749,7 @@ class CaptureFile(ABC):
             return
 
         self.data[self.header_by_alias("Elapsed Time")] += time_offset
+        self.data_version += 1
 
     def trim_time_axis(self, relation: str = "Before", cutoff: float = 0) -> None:
         """Adjust the 'active' portion of a file, primarily reducing."""
@@ -22,6 +22,7 @@ class SignalingDelegate(QStyledItemDelegate):
     """
 
     _table_headers: list[str] = list(stat_table_headers().keys())
+    _column_alignments: list = [v[0] for v in stat_table_headers().values()]
     _mutable_headers: list[str] = mutable_table_headers()
     _path_index: int = _table_headers.index("File Location")
     _stutter_columns: list[int] = [
@@ -35,7 +36,9 @@ class SignalingDelegate(QStyledItemDelegate):
     @classmethod
     def update_table_headers(cls) -> None:
         """Update class variables with current table headers."""
-        cls._table_headers = list(stat_table_headers().keys())
+        headers: dict[str, tuple] = stat_table_headers()
+        cls._table_headers = list(headers.keys())
+        cls._column_alignments = [v[0] for v in headers.values()]
 
     def createEditor(self, parent, option, index) -> None:
         """Only allow fields of mutable properties to be edited."""
@@ -49,6 +52,9 @@ class SignalingDelegate(QStyledItemDelegate):
         cfg = setting
         data = index.data()
         idx: int = index.column()
+
+        # Alignment is defined per column, so it isn't stored on every item in the model
+        option.displayAlignment = SignalingDelegate._column_alignments[idx]
         dark_mode: bool = session("DarkMode")
         diminishing_fallback: bool = cfg("General", "DiminishFallbacks") == "True"
 
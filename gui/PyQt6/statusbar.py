@@ -53,7 +53,8 @@ class StatusBarWithQueue(QStatusBar):
         for 666 milliseconds per word.
 
         If a message is currently displayed, append the message to a queue which will be checked
-        100 milliseconds after the current message has been cleared.
+        100 milliseconds after the current message has been cleared. Messages identical to the one
+        being displayed or the most recently queued message are discarded.
 
         Args:
             * message (str): The text to display on the status bar.
@@ -68,4 +69,6 @@ class StatusBarWithQueue(QStatusBar):
             QTimer.singleShot(msecs + 100, self.process_queue)
             return super().showMessage(message, msecs)  # Exit method to avoid re-appending
 
-        StatusBarWithQueue.message_queue.append(message)
+        queue: deque = StatusBarWithQueue.message_queue
+        if message != self.currentMessage() and (not queue or queue[-1] != message):
+            queue.append(message)
@@ -60,10 +60,10 @@ class DataFrameTableModel(QAbstractTableModel):
         """Return the data for the current index.
 
         This is called through many events: updating a model, hovering over a widget, selecting
-        an item from a list, etc.
+        an item from a list, etc., so cells are read with the scalar accessor instead of iloc.
         """
         if index.isValid() and role == Qt.ItemDataRole.DisplayRole:
-            return str(self._data.iloc[index.row(), index.column()])
+            return str(self._data.iat[index.row(), index.column()])
         return None
 
     def sort(self, column: int, direction: int) -> None:
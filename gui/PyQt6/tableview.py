@@ -45,11 +45,15 @@ class SharedEditTableView(QTableView):
             self.setColumnHidden(index, not is_visible)
         self.resizeColumnsToContents()
 
-    def reset_view(self) -> None:
-        """Reset the table to default state."""
+    def empty_model(self) -> QStandardItemModel:
+        """Return a model with the current column headers and no rows."""
         stats_model = QStandardItemModel(0, self.table_stats_header_count)
         stats_model.setHorizontalHeaderLabels(self.table_stats_header_labels)
-        self.setModel(stats_model)
+        return stats_model
+
+    def reset_view(self) -> None:
+        """Reset the table to default state."""
+        self.setModel(self.empty_model())
         self.resizeColumnsToContents()
 
     def commitData(self, editor) -> None:
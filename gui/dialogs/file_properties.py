@@ -19,8 +19,6 @@ class FilePropertyDialog(QDialog, Ui_Dialog):
     def __init__(self, plot_obj: PlotObject) -> None:
         super().__init__()
         self.setupUi(self)
-        self.changed_values: bool = False
-        self.plot_obj: PlotObject = plot_obj
 
         # Hide 'What's This?' button and disallow resizing
         flags = self.windowFlags()
@@ -28,7 +26,6 @@ class FilePropertyDialog(QDialog, Ui_Dialog):
             flags | Qt.WindowType.MSWindowsFixedSizeDialogHint | Qt.WindowType.CoverWindow
         )
 
-        self.setStyleSheet(f"{current_stylesheet()} QLineEdit:read-only {{color: #888}}")
         self.caution_label_pen_width.setStyleSheet("QLabel {min-height: 60px; max-height: 200px;}")
 
         # Show warning label for line widths above 1 pixel
@@ -37,6 +34,22 @@ class FilePropertyDialog(QDialog, Ui_Dialog):
             lambda: self.caution_label_pen_width.setVisible(self.spin_pen_width.value() > 1)
         )
 
+        self.load_plot_object(plot_obj)
+
+    def load_plot_object(self, plot_obj: PlotObject) -> None:
+        """Point the dialog at a PlotObject so the same window can be reused for any file.
+
+        Args:
+            * plot_obj (PlotObject): PlotObject whose file properties will be shown.
+        """
+        self.changed_values: bool = False
+        self.plot_obj: PlotObject = plot_obj
+
+        # The theme can change between uses, so only restyle when the stylesheet is out of date
+        stylesheet: str = f"{current_stylesheet()} QLineEdit:read-only {{color: #888}}"
+        if stylesheet != self.styleSheet():
+            self.setStyleSheet(stylesheet)
+
         # Use initial hash of file properties to detect changes
         self.update_widget_text()
         self.update_pen_parameters()
@@ -7,8 +7,8 @@ from PyQt6.QtWidgets import QDialog
 
 
 class HelpShortcutsDialog(QDialog, Ui_Dialog):
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, parent) -> None:
+        super().__init__(parent=parent)
         self.setupUi(self)
 
         # Hide 'What's This?' button and disallow resizing
@@ -17,4 +17,9 @@ class HelpShortcutsDialog(QDialog, Ui_Dialog):
             flags | Qt.WindowType.MSWindowsFixedSizeDialogHint | Qt.WindowType.CoverWindow
         )
 
-        self.setStyleSheet(current_stylesheet())
+    def exec(self) -> int:
+        """Apply the current stylesheet before executing, since the dialog may be reused."""
+        # Qt repolishes every child widget when a stylesheet is set, even an identical one
+        if (stylesheet := current_stylesheet()) != self.styleSheet():
+            self.setStyleSheet(stylesheet)
+        return super().exec()
@@ -1,13 +1,17 @@
 """This module is responsible for constructing and updating the Pydra GUI."""
 
 from base64 import urlsafe_b64encode
+from collections import defaultdict
+from functools import lru_cache, partial
 from json import dumps
-from logging import getLogger
-from os import getenv, getpid, walk
+from logging import DEBUG, INFO, getLogger
+from os import DirEntry, getenv, getpid, scandir
+from os.path import splitext
 from pathlib import Path
 from subprocess import run
 from time import perf_counter_ns
-from typing import Any, Callable, Generator
+from typing import Any, Callable, Generator, Optional
+from weakref import WeakKeyDictionary
 from webbrowser import open as open_browser
 
 from core.configuration import (
@@ -20,17 +24,18 @@ from core.configuration import (
     set_value,
     setting,
     setting_bool,
+    setting_float,
+    setting_int,
 )
 from core.exporter import output_location, write_file_view, write_stats_file
 from core.logger import GUILogger, get_logger, log_chapter, log_exception, log_table, logging_path
 from core.stopwatch import Welford, stopwatch, time_from_ns
-from core.update import current_version_str, update_available
+from core.update import current_version_str, update_available, version_file_request
 from core.utilities import (
     Tab,
     default_data_sources,
     preserve_marks,
     size_from_bytes,
-    stat_table_headers,
     time_scale,
     time_str_long,
 )
@@ -47,21 +52,35 @@ from gui.plotobject import PlotObject
 from gui.PyQt6.listwidget import FlexibleListItem
 from gui.PyQt6.statusbar import StatusBarWithQueue
 from gui.PyQt6.tablemodel import DataFrameTableModel
-from gui.PyQt6.tableview import CustomSortItem, SharedEditTableView, SignalingDelegate
+from gui.PyQt6.tableview import CustomSortItem, SignalingDelegate
 from gui.pyqtgraph.plotdataitem import ClickableErrorBarItem, UnclickableBarGraphItem
 from gui.pyqtgraph.plotwidget import ContextMenuPlotWidget
 from gui.pyqtgraph.viewbox import SquareLegendItem
+from gui.ratelimit import qdebounced, qthrottled
 from gui.styles import current_stylesheet, icon_path
 from gui.worker import Worker
-from numpy import min, repeat
-from pandas import DataFrame
+from numpy import min, ndarray, repeat
+from pandas import DataFrame, Series
 from psutil import Process
-from PyQt6.QtCore import Qt, QThreadPool, QTimer, pyqtSlot
-from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QFont, QFontDatabase, QShortcut
+from PyQt6.QtCore import Qt, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import (
+    QColor,
+    QDragEnterEvent,
+    QDropEvent,
+    QFont,
+    QFontDatabase,
+    QIcon,
+    QPen,
+    QShortcut,
+    QStandardItemModel,
+)
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply
 from PyQt6.QtWidgets import QApplication, QDialog, QFileDialog, QMainWindow, QMessageBox
-from pyqtgraph import PlotDataItem, SignalProxy, TextItem, setConfigOptions
+from pyqtgraph import PlotDataItem, SignalProxy, TextItem, mkColor, mkPen, setConfigOptions
+
+_FROZEN: bool = running_from_exe()
 
-if running_from_exe():
+if _FROZEN:
     # Change splash messages and hide the window after unpacking
     import pyi_splash
 
@@ -69,9 +88,234 @@ if running_from_exe():
 logger = get_logger(__name__)
 
 
+_DISCOVERY_BATCH_SIZE: int = 64  # Files per batch when streaming files from imported folders
+_EXPRESSION_MASK_LIMIT: int = 16  # Filter expression results kept for the browsed file
+
+# Tab indexes compared by frequently called slots
+_TAB_SCATTER: int = Tab.Scatter.value
+_TAB_EXPERIENCE: int = Tab.Experience.value
+
+
+def _total_file_size(file_list: list[Path]) -> int:
+    """Return the combined size of files in bytes, ignoring any that cannot be read."""
+    total_size: int = 0
+    for file in file_list:
+        try:
+            total_size += file.stat().st_size
+        except OSError:
+            continue
+    return total_size
+
+
+# Text appended to experience plot callout values for each of their units
+_CALLOUT_SUFFIXES: dict[str, str] = {"": "", "ms": " ms", "fps": " fps"}
+
+# Curves of each file that are drawn on the box plot
+_BOX_PLOT_CURVES: tuple[str, ...] = ("Box", "Error", "Outliers")
+
+# Plot items whose data is checked for negative values on clamped axes
+_RANGE_CURVE_TYPES: tuple[type, ...] = (PlotDataItem, UnclickableBarGraphItem)
+
+# Filter expression styles for invalid expressions, keyed by dark mode
+_EXPRESSION_ERROR_STYLES: dict[bool, str] = {
+    True: "QLineEdit {background-color:#382626; border-color:#fbeaea; color:#fbeaea;}",
+    False: "QLineEdit {background-color:#fff0f0; border-color:#af2121; color:#af2121;}",
+}
+
+# File properties edited through line edits of the file property dialog
+_PROPERTY_WIDGETS: tuple[tuple[str, str], ...] = (
+    ("Application", "line_property_application"),
+    ("Resolution", "line_property_resolution"),
+    ("Runtime", "line_property_runtime"),
+    ("GPU", "line_property_gpu"),
+    ("Comments", "line_property_comments"),
+)
+
+
+# Negative value checks of each curve by axis, stored along with the data they were computed from.
+# Entries are dropped along with their curves.
+_NEGATIVE_VALUES: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _has_negative_values(curve: Any, axis: str) -> bool:
+    """Return whether a curve contains negative values along an axis.
+
+    The result is cached along with the data it was computed from, so the data is only scanned
+    again once the curve has been given new data.
+    """
+    data = curve.xData if axis == "x" else curve.yData
+    cache: dict = _NEGATIVE_VALUES.setdefault(curve, {})
+
+    cached_data, negative = cache.get(axis, (None, False))
+    if data is None or cached_data is not data:
+        negative = bool(min(data) < 0)
+        cache[axis] = (data, negative)
+    return negative
+
+
+def splash_message(message: str) -> None:
+    """Update the splash screen text while the frozen executable is starting up."""
+    if _FROZEN:
+        pyi_splash.update_text(message)
+
+
+# Getter and change signal of the widgets used by each config binding setter
+_BINDING_ACCESSORS: dict[str, tuple[str, str]] = {
+    "setChecked": ("isChecked", "clicked"),
+    "setCurrentText": ("currentText", "currentTextChanged"),
+    "setText": ("text", "textChanged"),
+    "setValue": ("value", "valueChanged"),
+}
+
+
+def _bool_text(section: str, option: str) -> str:
+    """Return a boolean config option as text, used by combo boxes with True/False items."""
+    return str(setting_bool(section, option))
+
+
+_TITLE_TAGS: tuple[str, ...] = (
+    "Application",
+    "Resolution",
+    "Runtime",
+    "GPU",
+    "PlotType",
+    "DataSource",
+)
+
+
+@lru_cache(maxsize=16)
+def _title_template(title_format: str) -> str:
+    """Convert a plot title format into a template for str.format_map.
+
+    Literal braces are escaped first so that only the bracketed title tags become fields.
+    """
+    template: str = title_format.replace("{", "{{").replace("}", "}}")
+    for tag in _TITLE_TAGS:
+        template = template.replace(f"[{tag}]", f"{{{tag}}}")
+    return template
+
+
 class MainWindow(QMainWindow, Ui_MainWindow):
     """Builds and updates a PyQt6 GUI."""
 
+    # Widgets whose values mirror a config option, grouped by config section. Each binding is
+    # defined as (option, widget, setter, reader). The statistics section is managed separately
+    # by gui.dialogs.stat_metrics.
+    CONFIG_BINDINGS: dict[str, tuple] = {
+        "General": (
+            ("TimeScale", "combo_line_time_scale", "setCurrentText", setting),
+            ("TimeScale", "combo_stats_time_scale", "setCurrentText", setting),
+            ("DiminishFallbacks", "check_diminish_fallbacks", "setChecked", setting_bool),
+            ("MaxIOThreads", "spin_max_threads", "setValue", setting_int),
+            ("DropNAColumns", "combo_drop_na_cols", "setCurrentText", _bool_text),
+            ("CompressionMinSizeMB", "spin_compress_size", "setValue", setting_int),
+            ("DecimalPlaces", "spin_decimal_places", "setValue", setting_int),
+        ),
+        "Plotting": (
+            ("Renderer", "combo_renderer", "setCurrentText", setting),
+            ("Antialiasing", "combo_use_antialiasing", "setCurrentText", setting),
+            ("PlotEmptyData", "combo_plot_empty_data", "setCurrentText", _bool_text),
+            ("NormalAlpha", "spin_normal_alpha", "setValue", setting_int),
+            ("EmphasizedAlpha", "spin_emphasized_alpha", "setValue", setting_int),
+            ("DiminishedAlpha", "spin_diminished_alpha", "setValue", setting_int),
+            ("AxisLabelFontSize", "spin_axis_label_size", "setValue", setting_int),
+            ("AxisLabelOffset", "spin_tick_text_offset", "setValue", setting_int),
+            ("AxisTickLength", "spin_axis_tick_length", "setValue", setting_int),
+            ("MainTitleFontSize", "spin_main_title_size", "setValue", setting_int),
+            ("MainTitleFormat", "line_main_title", "setText", setting),
+            ("LegendItemFormat", "line_legend_item", "setText", setting),
+            ("LegendItemFontSize", "spin_legend_font_size", "setValue", setting_int),
+        ),
+        "Crosshair": (
+            ("CursorUpdateRate", "spin_crosshair_update_rate", "setValue", setting_int),
+            ("UseDownsampling", "combo_use_downsampling", "setCurrentText", setting),
+            ("SampleRate", "spin_sample_rate", "setValue", setting_int),
+        ),
+        "Line": (
+            ("ClampXMinimum", "check_clamp_x_min", "setChecked", setting_bool),
+            ("ClampYMinimum", "check_clamp_y_min", "setChecked", setting_bool),
+        ),
+        "Percentiles": (
+            ("ClampYMinimum", "check_clamp_percentiles_y_min", "setChecked", setting_bool),
+            ("PercentileStart", "spin_percentile_start", "setValue", setting_float),
+            ("PercentileEnd", "spin_percentile_end", "setValue", setting_float),
+            ("PercentileStep", "spin_percentile_step", "setValue", setting_float),
+        ),
+        "Histogram": (
+            ("ClampXMinimum", "check_clamp_histogram_x_min", "setChecked", setting_bool),
+            ("ClampYMinimum", "check_clamp_histogram_y_min", "setChecked", setting_bool),
+            ("HistogramBinSize", "spin_histogram_bins", "setValue", setting_int),
+        ),
+        "Box": (
+            ("ClampXMinimum", "check_clamp_box_x_min", "setChecked", setting_bool),
+            ("ClampYMinimum", "check_clamp_box_y_min", "setChecked", setting_bool),
+            ("HideLegend", "check_box_hide_legend", "setChecked", setting_bool),
+            ("OutlierValues", "combo_box_plot_outliers", "setCurrentText", setting),
+            ("Height", "spin_box_height", "setValue", setting_int),
+            ("Spacing", "spin_box_spacing", "setValue", setting_int),
+        ),
+        "Scatter": (
+            ("ClampXMinimum", "check_clamp_scatter_x_min", "setChecked", setting_bool),
+            ("ClampYMinimum", "check_clamp_scatter_y_min", "setChecked", setting_bool),
+        ),
+        "Experience": (
+            ("CalloutTextSize", "spin_experience_callout_size", "setValue", setting_int),
+            ("HideLegend", "check_experience_hide_legend", "setChecked", setting_bool),
+            ("Height", "spin_experience_height", "setValue", setting_int),
+            ("Spacing", "spin_experience_spacing", "setValue", setting_int),
+        ),
+        "StutterHeuristic": (
+            ("StutterDeltaMs", "spin_stutter_delta_ms", "setValue", setting_float),
+            ("StutterDeltaPct", "spin_stutter_delta_pct", "setValue", setting_float),
+            ("StutterWindowSize", "spin_stutter_window_size", "setValue", setting_int),
+            ("StutterWarnPct", "spin_stutter_warn_pct", "setValue", setting_float),
+            ("StutterWarnAvg", "spin_stutter_warn_avg", "setValue", setting_float),
+            ("StutterWarnMax", "spin_stutter_warn_max", "setValue", setting_float),
+        ),
+        "OscillationHeuristic": (
+            ("TestForOscillation", "group_settings_oscillation", "setChecked", setting_bool),
+            ("OscDeltaMs", "spin_osc_delta_ms", "setValue", setting_float),
+            ("OscDeltaPct", "spin_osc_delta_pct", "setValue", setting_float),
+            ("OscWarnPct", "spin_osc_warn_pct", "setValue", setting_float),
+        ),
+        "BatteryLife": (
+            ("BatteryMaxLevel", "spin_battery_max_level", "setValue", setting_int),
+            ("BatteryMinLevel", "spin_battery_min_level", "setValue", setting_int),
+        ),
+        "Exporting": (
+            ("SavePath", "line_exporting_path", "setText", setting),
+            ("ImageFormat", "combo_image_format", "setCurrentText", setting),
+        ),
+        "Logger": (
+            ("LoggingPath", "line_logging_path", "setText", setting),
+            ("MaxFiles", "spin_log_max_number", "setValue", setting_int),
+        ),
+        "Metadata": (
+            ("ExpirationTime", "spin_metadata_expiration", "setValue", setting_int),
+        ),
+        "Development": (
+            ("StopwatchCI", "spin_stopwatch_conf_interval", "setValue", setting_float),
+            ("StopwatchStdError", "spin_stopwatch_std_err_target", "setValue", setting_float),
+            ("SignalProxyRate", "spin_dev_signal_rate", "setValue", setting_int),
+            ("StopwatchTimeLimit", "spin_stopwatch_loop_timeout", "setValue", setting_int),
+            ("TimekeeperKey", "combo_timekeeper_key", "setCurrentText", setting),
+        ),
+    }
+
+    # Emitted from a worker thread with batches of files found while walking imported folders.
+    # Batch sizes are passed as Python ints since they can exceed the range of a C++ int.
+    files_discovered = pyqtSignal(list, object)
+
+    config_bindings_connected: bool = False
+    last_refused_drag_log: int = 0
+    last_axis_style: tuple = ()
+    last_stylesheet: str = ""
+    last_plot_layout: tuple = ()
+    last_scatter_state: tuple = ()
+    plots: Optional[dict] = None  # Defined in prepare_plots, after the user config is loaded
+    axis_label_style: tuple[tuple, dict[str, str]] = ((), {})
+    expression_masks: tuple[tuple, dict[str, Series]] = ((), {})
+
     def __init__(self) -> None:
         """Initialize the GUI.
 
@@ -96,14 +340,24 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.schedule_events()
         self.check_for_updates()
 
-        if running_from_exe():
+        if _FROZEN:
             pyi_splash.close()
 
     def closeEvent(self, event) -> None:
-        """Attempt safer cleanup before closing main window."""
+        """Attempt safer cleanup before closing main window.
+
+        Queued file reads are dropped, and reads already in progress are given a bounded amount of
+        time to finish so that their metadata records are complete before the metadata file is
+        written.
+        """
+        self.persist_metric_visibility.flush()
+
         if self.pool.activeThreadCount() != 0:
             logger.warning("Close event called with active file reads!")
             self.pool.clear()
+            if not self.pool.waitForDone(2000):
+                logger.warning("File reads did not finish before writing metadata")
+
         update_metadata_file()
         return super().closeEvent(event)
 
@@ -124,7 +378,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # Hide development/experimental options group when running from frozen exe. Widgets inside
         # this group should not have their slots connected to ensure consistent behavior. Values
         # exposed through the configuration file will always serve the default value.
-        if running_from_exe():
+        if _FROZEN:
             self.group_settings_development.setHidden(True)
 
         # Set up progress bar
@@ -138,66 +392,48 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     @stopwatch(silent=True)
     def manage_threadpool(self) -> None:
         """Set up the thread pool and related variables for I/O processing."""
-        if running_from_exe():
-            pyi_splash.update_text("Managing threadpool...")
+        splash_message("Managing threadpool...")
 
         self.pool: QThreadPool = QThreadPool().globalInstance()
-        self.pool.setMaxThreadCount(int(setting("General", "MaxIOThreads")))
+        self.pool.setMaxThreadCount(setting_int("General", "MaxIOThreads"))
 
         # Vars for tracking file processing time
         self.batch_count: int = 0
         self.batch_size: int = 0
         self.batch_time: int = 0
+        self.active_workers: int = 0  # Import workers that have not finished yet
+        self.batch_in_progress: bool = False  # Defers combo model updates until a batch ends
+
+        # Rows for newly discovered files, which are added to the loaded files list together
+        self.pending_list_items: dict[str, FlexibleListItem] = {}
 
     @stopwatch(silent=True)
     def get_runtime_info(self) -> None:
         """Get the application's base path. This is used for relative paths with icons and QSS."""
-        if running_from_exe():
-            pyi_splash.update_text("Gathering runtime info...")
+        splash_message("Gathering runtime info...")
 
         self.base_path: str = app_root()
 
         logger.debug(
-            f"Running from {'frozen' if running_from_exe() else 'normal'} environment - "
-            f"unhandled exceptions will {'' if running_from_exe() else 'NOT '}be suppressed"
+            f"Running from {'frozen' if _FROZEN else 'normal'} environment - "
+            f"unhandled exceptions will {'' if _FROZEN else 'NOT '}be suppressed"
         )
 
     @stopwatch(silent=True)
     def load_user_config(self) -> None:
         """Set and connect widgets with their respective configuration values."""
-        if running_from_exe():
-            pyi_splash.update_text("Importing user config...")
+        splash_message("Importing user config...")
 
         try:
-            self.general_config_options()
-            self.plotting_config_options()
-            self.crosshair_config_options()
-            self.line_config_options()
-            self.percentile_config_options()
-            self.histogram_config_options()
-            self.box_config_options()
-            self.scatter_config_options()
-            self.experience_config_options()
-            self.stutter_config_options()
-            self.oscillation_config_options()
-            self.battery_config_options()
-            self.exporting_config_options()
-            self.logging_config_options()
-            self.metadata_config_options()
-            # self.statistics_config_options()  # Managed by gui.dialogs.stat_metrics
-
-            if not running_from_exe():
-                self.development_config_options()
-
-            # Enable/disable widgets based on field values
-            self.combo_use_downsampling.currentTextChanged.connect(
-                lambda: self.spin_sample_rate.setEnabled(
-                    self.combo_use_downsampling.currentText() == "Static"
-                )
-            )
+            self.apply_config_bindings()
+            self.update_percentile_steps(refresh=False)
+            self.spin_sample_rate.setEnabled(setting("Crosshair", "UseDownsampling") == "Static")
             self.combo_use_antialiasing.setDisabled(self.combo_renderer.currentText() == "OpenGL")
+
+            if not self.config_bindings_connected:
+                self.connect_config_bindings()
         except ValueError:
-            if running_from_exe():
+            if _FROZEN:
                 pyi_splash.close()
 
             QMessageBox.information(
@@ -210,291 +446,53 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         except Exception as e:
             log_exception(logger, e)
 
-    def general_config_options(self, sect: str = "General") -> None:
-        """Set and connect general configuration options."""
-        self.btn_toggle_css.setChecked(setting_bool(sect, "UseDarkStylesheet"))
-        self.combo_line_time_scale.setCurrentText(setting(sect, "TimeScale"))
-        self.combo_stats_time_scale.setCurrentText(setting(sect, "TimeScale"))
-        self.check_diminish_fallbacks.setChecked(setting_bool(sect, "DiminishFallbacks"))
-        self.spin_max_threads.setValue(int(setting(sect, "MaxIOThreads")))
-        self.combo_drop_na_cols.setCurrentText(str(setting_bool(sect, "DropNAColumns")))
-        self.spin_compress_size.setValue(int(setting(sect, "CompressionMinSizeMB")))
-        self.spin_decimal_places.setValue(int(setting(sect, "DecimalPlaces")))
-
-        self.spin_max_threads.valueChanged.connect(lambda x: set_value(sect, "MaxIOThreads", x))
-        self.combo_line_time_scale.currentTextChanged.connect(
-            lambda x: set_value(sect, "TimeScale", x)
-        )
-        self.combo_stats_time_scale.currentTextChanged.connect(
-            lambda x: set_value(sect, "TimeScale", x)
-        )
-        self.check_diminish_fallbacks.clicked.connect(
-            lambda x: set_value(sect, "DiminishFallbacks", x)
-        )
-        self.combo_drop_na_cols.currentTextChanged.connect(
-            lambda x: set_value(sect, "DropNAColumns", x)
-        )
-        self.spin_compress_size.valueChanged.connect(
-            lambda x: set_value(sect, "CompressionMinSizeMB", x)
-        )
-        self.spin_decimal_places.valueChanged.connect(lambda x: set_value(sect, "DecimalPlaces", x))
-
-    def plotting_config_options(self, sect: str = "Plotting") -> None:
-        """Set and connect configuration options for general plotting."""
-        self.combo_renderer.setCurrentText(setting(sect, "Renderer"))
-        self.combo_use_antialiasing.setCurrentText(setting(sect, "Antialiasing"))
-        self.combo_plot_empty_data.setCurrentText(str(setting_bool(sect, "PlotEmptyData")))
-        self.spin_normal_alpha.setValue(int(setting(sect, "NormalAlpha")))
-        self.spin_emphasized_alpha.setValue(int(setting(sect, "EmphasizedAlpha")))
-        self.spin_diminished_alpha.setValue(int(setting(sect, "DiminishedAlpha")))
-        self.spin_axis_label_size.setValue(int(setting(sect, "AxisLabelFontSize")))
-        self.spin_tick_text_offset.setValue(int(setting(sect, "AxisLabelOffset")))
-        self.spin_axis_tick_length.setValue(int(setting(sect, "AxisTickLength")))
-        self.spin_main_title_size.setValue(int(setting(sect, "MainTitleFontSize")))
-        self.line_main_title.setText(setting(sect, "MainTitleFormat"))
-        self.line_legend_item.setText(setting(sect, "LegendItemFormat"))
-        self.spin_legend_font_size.setValue(int(setting(sect, "LegendItemFontSize")))
-
-        self.combo_renderer.currentTextChanged.connect(lambda x: set_value(sect, "Renderer", x))
-        self.combo_use_antialiasing.currentTextChanged.connect(
-            lambda x: set_value(sect, "Antialiasing", x)
-        )
-        self.combo_plot_empty_data.currentTextChanged.connect(
-            lambda x: set_value(sect, "PlotEmptyData", x)
-        )
-        self.spin_normal_alpha.valueChanged.connect(lambda x: set_value(sect, "NormalAlpha", x))
-        self.spin_emphasized_alpha.valueChanged.connect(
-            lambda x: set_value(sect, "EmphasizedAlpha", x)
-        )
-        self.spin_diminished_alpha.valueChanged.connect(
-            lambda x: set_value(sect, "DiminishedAlpha", x)
-        )
-        self.spin_axis_label_size.valueChanged.connect(
-            lambda x: set_value(sect, "AxisLabelFontSize", x)
-        )
-        self.spin_tick_text_offset.valueChanged.connect(
-            lambda x: set_value(sect, "AxisLabelOffset", x)
-        )
-        self.spin_axis_tick_length.valueChanged.connect(
-            lambda x: set_value(sect, "AxisTickLength", x)
-        )
-        self.spin_main_title_size.valueChanged.connect(
-            lambda x: set_value(sect, "MainTitleFontSize", x)
-        )
-        self.line_main_title.textChanged.connect(lambda x: set_value(sect, "MainTitleFormat", x))
-        self.line_legend_item.textChanged.connect(lambda x: set_value(sect, "LegendItemFormat", x))
-        self.spin_legend_font_size.valueChanged.connect(
-            lambda x: set_value(sect, "LegendItemFontSize", x)
-        )
-
-    def crosshair_config_options(self, sect: str = "Crosshair") -> None:
-        """Set and connect configuration options for the crosshair cursor."""
-        self.spin_crosshair_update_rate.setValue(int(setting(sect, "CursorUpdateRate")))
-        self.combo_use_downsampling.setCurrentText(str(setting(sect, "UseDownsampling")))
-        self.spin_sample_rate.setValue(int(setting(sect, "SampleRate")))
-        self.spin_sample_rate.setEnabled(setting(sect, "UseDownsampling") == "Static")
-
-        self.spin_crosshair_update_rate.valueChanged.connect(
-            lambda x: set_value(sect, "CursorUpdateRate", x)
-        )
-        self.combo_use_downsampling.currentTextChanged.connect(
-            lambda x: set_value(sect, "UseDownsampling", x)
-        )
-        self.spin_sample_rate.valueChanged.connect(lambda x: set_value(sect, "SampleRate", x))
-
-    def line_config_options(self, sect: str = "Line") -> None:
-        """Set and connect configuration options for the line plot."""
-        self.check_clamp_x_min.setChecked(setting_bool(sect, "ClampXMinimum"))
-        self.check_clamp_y_min.setChecked(setting_bool(sect, "ClampYMinimum"))
-
-        self.check_clamp_x_min.clicked.connect(lambda x: set_value(sect, "ClampXMinimum", x))
-        self.check_clamp_y_min.clicked.connect(lambda x: set_value(sect, "ClampYMinimum", x))
+    def config_bindings(self) -> Generator:
+        """Yield the section, option, and widget binding of each applicable config option.
 
-    def percentile_config_options(self, sect: str = "Percentiles") -> None:
-        """Set and connect configuration options for the percentile plot."""
-        self.check_clamp_percentiles_y_min.setChecked(setting_bool(sect, "ClampYMinimum"))
-        self.spin_percentile_start.setValue(float(setting(sect, "PercentileStart")))
-        self.spin_percentile_end.setValue(float(setting(sect, "PercentileEnd")))
-        self.spin_percentile_step.setValue(float(setting(sect, "PercentileStep")))
-        self.update_percentile_steps(refresh=False)
-
-        self.check_clamp_percentiles_y_min.clicked.connect(
-            lambda x: set_value(sect, "ClampYMinimum", x)
-        )
-        self.spin_percentile_start.valueChanged.connect(
-            lambda x: set_value(sect, "PercentileStart", x)
-        )
-        self.spin_percentile_end.valueChanged.connect(lambda x: set_value(sect, "PercentileEnd", x))
-        self.spin_percentile_step.valueChanged.connect(
-            lambda x: set_value(sect, "PercentileStep", x)
-        )
-
-    def histogram_config_options(self, sect: str = "Histogram") -> None:
-        """Set and connect configuration options for the histogram plot."""
-        self.check_clamp_histogram_x_min.setChecked(setting_bool(sect, "ClampXMinimum"))
-        self.check_clamp_histogram_y_min.setChecked(setting_bool(sect, "ClampYMinimum"))
-        self.spin_histogram_bins.setValue(int(setting(sect, "HistogramBinSize")))
-
-        self.check_clamp_histogram_x_min.clicked.connect(
-            lambda x: set_value(sect, "ClampXMinimum", x)
-        )
-        self.check_clamp_histogram_y_min.clicked.connect(
-            lambda x: set_value(sect, "ClampYMinimum", x)
-        )
-        self.spin_histogram_bins.valueChanged.connect(
-            lambda x: set_value(sect, "HistogramBinSize", x)
-        )
-
-    def box_config_options(self, sect: str = "Box") -> None:
-        """Set and connect configuration options for the box plot."""
-        self.check_clamp_box_x_min.setChecked(setting_bool(sect, "ClampXMinimum"))
-        self.check_clamp_box_y_min.setChecked(setting_bool(sect, "ClampYMinimum"))
-        self.check_box_hide_legend.setChecked(setting_bool(sect, "HideLegend"))
-        self.combo_box_plot_outliers.setCurrentText(setting(sect, "OutlierValues"))
-        self.spin_box_height.setValue(int(setting(sect, "Height")))
-        self.spin_box_spacing.setValue(int(setting(sect, "Spacing")))
-
-        self.check_clamp_box_x_min.clicked.connect(lambda x: set_value(sect, "ClampXMinimum", x))
-        self.check_clamp_box_y_min.clicked.connect(lambda x: set_value(sect, "ClampYMinimum", x))
-        self.check_box_hide_legend.clicked.connect(lambda x: set_value(sect, "HideLegend", x))
-        self.combo_box_plot_outliers.currentTextChanged.connect(
-            lambda x: set_value(sect, "OutlierValues", x)
-        )
-        self.spin_box_height.valueChanged.connect(lambda x: set_value(sect, "Height", x))
-        self.spin_box_spacing.valueChanged.connect(lambda x: set_value(sect, "Spacing", x))
+        Development options are skipped when running from a frozen exe since their widgets are
+        hidden and must always serve the default value.
+        """
+        for section, bindings in MainWindow.CONFIG_BINDINGS.items():
+            if section == "Development" and _FROZEN:
+                continue
+            for option, widget_name, setter, reader in bindings:
+                yield section, option, getattr(self, widget_name), setter, reader
 
-    def scatter_config_options(self, sect: str = "Scatter") -> None:
-        """Set and connect configuration options for the scatter plot."""
-        self.check_clamp_scatter_x_min.setChecked(setting_bool(sect, "ClampXMinimum"))
-        self.check_clamp_scatter_y_min.setChecked(setting_bool(sect, "ClampYMinimum"))
+    def apply_config_bindings(self) -> None:
+        """Set each bound widget to the current value of its config option."""
+        self.btn_toggle_css.setChecked(setting_bool("General", "UseDarkStylesheet"))
 
-        self.check_clamp_scatter_x_min.clicked.connect(
-            lambda x: set_value(sect, "ClampXMinimum", x)
-        )
-        self.check_clamp_scatter_y_min.clicked.connect(
-            lambda x: set_value(sect, "ClampYMinimum", x)
-        )
+        for section, option, widget, setter, reader in self.config_bindings():
+            getattr(widget, setter)(reader(section, option))
 
-    def experience_config_options(self, sect: str = "Experience") -> None:
-        """Set and connect configuration options for the experience plot."""
-        self.spin_experience_callout_size.setValue(int(setting(sect, "CalloutTextSize")))
-        self.check_experience_hide_legend.setChecked(setting_bool(sect, "HideLegend"))
-        self.spin_experience_height.setValue(int(setting(sect, "Height")))
-        self.spin_experience_spacing.setValue(int(setting(sect, "Spacing")))
+    def connect_config_bindings(self) -> None:
+        """Connect each bound widget to the shared slot that writes its value back to the config.
 
-        self.spin_experience_callout_size.valueChanged.connect(
-            lambda x: set_value(sect, "CalloutTextSize", x)
-        )
-        self.check_experience_hide_legend.clicked.connect(
-            lambda x: set_value(sect, "HideLegend", x)
-        )
-        self.spin_experience_height.valueChanged.connect(lambda x: set_value(sect, "Height", x))
-        self.spin_experience_spacing.valueChanged.connect(lambda x: set_value(sect, "Spacing", x))
-
-    def stutter_config_options(self, sect: str = "StutterHeuristic") -> None:
-        """Set and connect configuration options for stutter heuristics."""
-        self.spin_stutter_delta_ms.setValue(float(setting(sect, "StutterDeltaMs")))
-        self.spin_stutter_delta_pct.setValue(float(setting(sect, "StutterDeltaPct")))
-        self.spin_stutter_window_size.setValue(int(setting(sect, "StutterWindowSize")))
-        self.spin_stutter_warn_pct.setValue(float(setting(sect, "StutterWarnPct")))
-        self.spin_stutter_warn_avg.setValue(float(setting(sect, "StutterWarnAvg")))
-        self.spin_stutter_warn_max.setValue(float(setting(sect, "StutterWarnMax")))
-
-        self.spin_stutter_delta_ms.valueChanged.connect(
-            lambda x: set_value(sect, "StutterDeltaMs", x)
-        )
-        self.spin_stutter_delta_pct.valueChanged.connect(
-            lambda x: set_value(sect, "StutterDeltaPct", x)
-        )
-        self.spin_stutter_window_size.valueChanged.connect(
-            lambda x: set_value(sect, "StutterWindowSize", x)
-        )
-        self.spin_stutter_warn_pct.valueChanged.connect(
-            lambda x: set_value(sect, "StutterWarnPct", x)
-        )
-        self.spin_stutter_warn_avg.valueChanged.connect(
-            lambda x: set_value(sect, "StutterWarnAvg", x)
-        )
-        self.spin_stutter_warn_max.valueChanged.connect(
-            lambda x: set_value(sect, "StutterWarnMax", x)
-        )
+        Only called once, since reloading the config (e.g., after a reset) only needs to update
+        the widget values.
+        """
+        self.bound_options: dict = {}
 
-    def oscillation_config_options(self, sect: str = "OscillationHeuristic") -> None:
-        """Set and connect configuration options for oscillation heuristics."""
-        self.group_settings_oscillation.setChecked(setting_bool(sect, "TestForOscillation"))
-        self.spin_osc_delta_ms.setValue(float(setting(sect, "OscDeltaMs")))
-        self.spin_osc_delta_pct.setValue(float(setting(sect, "OscDeltaPct")))
-        self.spin_osc_warn_pct.setValue(float(setting(sect, "OscWarnPct")))
+        for section, option, widget, setter, _ in self.config_bindings():
+            getter, signal = _BINDING_ACCESSORS[setter]
+            self.bound_options[widget] = (section, option, getter)
+            getattr(widget, signal).connect(self.config_binding_changed)
 
-        self.group_settings_oscillation.clicked.connect(
-            lambda x: set_value(sect, "TestForOscillation", x)
+        # Enable/disable widgets based on field values
+        self.combo_use_downsampling.currentTextChanged.connect(
+            lambda: self.spin_sample_rate.setEnabled(
+                self.combo_use_downsampling.currentText() == "Static"
+            )
         )
         self.group_settings_oscillation.clicked.connect(self.update_stutter_parameters)
-        self.spin_osc_delta_ms.valueChanged.connect(lambda x: set_value(sect, "OscDeltaMs", x))
-        self.spin_osc_delta_pct.valueChanged.connect(lambda x: set_value(sect, "OscDeltaPct", x))
-        self.spin_osc_warn_pct.valueChanged.connect(lambda x: set_value(sect, "OscWarnPct", x))
-
-    def battery_config_options(self, sect: str = "BatteryLife") -> None:
-        """Set and connect configuration options for battery life projection."""
-        self.spin_battery_max_level.setValue(int(setting(sect, "BatteryMaxLevel")))
-        self.spin_battery_min_level.setValue(int(setting(sect, "BatteryMinLevel")))
+        self.config_bindings_connected = True
 
-        self.spin_battery_max_level.valueChanged.connect(
-            lambda x: set_value(sect, "BatteryMaxLevel", x)
-        )
-        self.spin_battery_min_level.valueChanged.connect(
-            lambda x: set_value(sect, "BatteryMinLevel", x)
-        )
-
-    def exporting_config_options(self, sect: str = "Exporting") -> None:
-        """Set and connect configuration options for data export."""
-        self.line_exporting_path.setText(setting(sect, "SavePath"))
-        self.combo_image_format.setCurrentText(setting(sect, "ImageFormat"))
-
-        self.line_exporting_path.textChanged.connect(lambda x: set_value(sect, "SavePath", x))
-        self.combo_image_format.currentTextChanged.connect(
-            lambda x: set_value(sect, "ImageFormat", x)
-        )
-
-    def logging_config_options(self, sect: str = "Logger") -> None:
-        """Set and connect configuration options for the logging environment."""
-        self.line_logging_path.setText(setting(sect, "LoggingPath"))
-        self.spin_log_max_number.setValue(int(setting(sect, "MaxFiles")))
-
-        self.line_logging_path.textChanged.connect(lambda x: set_value(sect, "LoggingPath", x))
-        self.spin_log_max_number.valueChanged.connect(lambda x: set_value(sect, "MaxFiles", x))
-
-    def metadata_config_options(self, sect: str = "Metadata") -> None:
-        """Set and connect configuration options for file metadata."""
-        self.spin_metadata_expiration.setValue(int(setting(sect, "ExpirationTime")))
-
-        self.spin_metadata_expiration.valueChanged.connect(
-            lambda x: set_value(sect, "ExpirationTime", x)
-        )
-
-    def development_config_options(self, sect: str = "Development") -> None:
-        """Set and connect configuration options for development parameters."""
-        self.spin_stopwatch_conf_interval.setValue(float(setting(sect, "StopwatchCI")))
-        self.spin_stopwatch_std_err_target.setValue(float(setting(sect, "StopwatchStdError")))
-        self.spin_dev_signal_rate.setValue(int(setting(sect, "SignalProxyRate")))
-        self.spin_stopwatch_loop_timeout.setValue(int(setting(sect, "StopwatchTimeLimit")))
-        self.combo_timekeeper_key.setCurrentText(setting(sect, "TimekeeperKey"))
-
-        self.spin_stopwatch_conf_interval.valueChanged.connect(
-            lambda x: set_value(sect, "StopwatchCI", x)
-        )
-        self.spin_stopwatch_std_err_target.valueChanged.connect(
-            lambda x: set_value(sect, "StopwatchStdError", x)
-        )
-        self.spin_dev_signal_rate.valueChanged.connect(
-            lambda x: set_value(sect, "SignalProxyRate", x)
-        )
-        self.spin_stopwatch_loop_timeout.valueChanged.connect(
-            lambda x: set_value(sect, "StopwatchTimeLimit", x)
-        )
-        self.combo_timekeeper_key.currentTextChanged.connect(
-            lambda x: set_value(sect, "TimekeeperKey", x)
-        )
+    @pyqtSlot()
+    def config_binding_changed(self) -> None:
+        """Write the value of the widget that emitted a signal to its bound config option."""
+        widget = self.sender()
+        section, option, getter = self.bound_options[widget]
+        set_value(section, option, getattr(widget, getter)())
 
     @stopwatch(silent=True)
     def connect_widget_signals(self) -> None:
@@ -509,8 +507,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         disrupting the user experience. If the function benefits from a moderated signal rate, it
         should be connected through `connect_signal_proxies()` instead.
         """
-        if running_from_exe():
-            pyi_splash.update_text("Connecting signals...")
+        splash_message("Connecting signals...")
 
         # Push buttons
         self.btn_import_file.clicked.connect(self.add_files)
@@ -578,46 +575,33 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.combo_stats_time_scale.currentTextChanged.connect(self.update_dynamic_headers)
 
         # Line edit boxes (text fields)
-        self.line_browse_expression.textChanged.connect(self.browse_by_expression)
+        # Only the expression entered after typing pauses is parsed and applied
+        self.line_browse_expression.textChanged.connect(
+            qdebounced(self.browse_by_expression, timeout=150, parent=self)
+        )
         self.line_main_title.textChanged.connect(self.translate_plot_titles)
         self.line_legend_item.textEdited.connect(self.update_legend_labels)
         self.spin_legend_font_size.valueChanged.connect(self.refresh_plots)
-        self.line_filter_include_type.textChanged.connect(
-            lambda x: self.filter_loaded_files(True, "Capture Type", x)
-        )
-        self.line_filter_exclude_type.textChanged.connect(
-            lambda x: self.filter_loaded_files(False, "Capture Type", x)
-        )
-        self.line_filter_include_application.textChanged.connect(
-            lambda x: self.filter_loaded_files(True, "Application", x)
-        )
-        self.line_filter_exclude_application.textChanged.connect(
-            lambda x: self.filter_loaded_files(False, "Application", x)
-        )
-        self.line_filter_include_resolution.textChanged.connect(
-            lambda x: self.filter_loaded_files(True, "Resolution", x)
-        )
-        self.line_filter_exclude_resolution.textChanged.connect(
-            lambda x: self.filter_loaded_files(False, "Resolution", x)
-        )
-        self.line_filter_include_runtime.textChanged.connect(
-            lambda x: self.filter_loaded_files(True, "Runtime", x)
-        )
-        self.line_filter_exclude_runtime.textChanged.connect(
-            lambda x: self.filter_loaded_files(False, "Runtime", x)
-        )
-        self.line_filter_include_gpu.textChanged.connect(
-            lambda x: self.filter_loaded_files(True, "GPU", x)
-        )
-        self.line_filter_exclude_gpu.textChanged.connect(
-            lambda x: self.filter_loaded_files(False, "GPU", x)
-        )
-        self.line_filter_include_filename.textChanged.connect(
-            lambda x: self.filter_loaded_files(True, "File Name", x)
-        )
-        self.line_filter_exclude_filename.textChanged.connect(
-            lambda x: self.filter_loaded_files(False, "File Name", x)
-        )
+
+        # File filter fields, defined as (line edit, include, field)
+        filter_lines: tuple = (
+            (self.line_filter_include_type, True, "Capture Type"),
+            (self.line_filter_exclude_type, False, "Capture Type"),
+            (self.line_filter_include_application, True, "Application"),
+            (self.line_filter_exclude_application, False, "Application"),
+            (self.line_filter_include_resolution, True, "Resolution"),
+            (self.line_filter_exclude_resolution, False, "Resolution"),
+            (self.line_filter_include_runtime, True, "Runtime"),
+            (self.line_filter_exclude_runtime, False, "Runtime"),
+            (self.line_filter_include_gpu, True, "GPU"),
+            (self.line_filter_exclude_gpu, False, "GPU"),
+            (self.line_filter_include_filename, True, "File Name"),
+            (self.line_filter_exclude_filename, False, "File Name"),
+        )
+        for line_edit, include, field in filter_lines:
+            line_edit.textChanged.connect(
+                qdebounced(partial(self.filter_loaded_files, include, field), parent=self)
+            )
 
         # Spinner boxes
         self.spin_normal_alpha.valueChanged.connect(PlotObject.adjust_alpha_by_selection)
@@ -626,32 +610,66 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.spin_diminished_alpha.valueChanged.connect(PlotObject.adjust_alpha_by_selection)
         self.spin_axis_label_size.valueChanged.connect(self.translate_axis_labels)
         self.spin_main_title_size.valueChanged.connect(self.translate_plot_titles)
-        self.spin_crosshair_update_rate.valueChanged.connect(self.pyqtgraph_line.redraw_crosshair)
-        self.spin_crosshair_update_rate.editingFinished.connect(
-            self.pyqtgraph_line.redraw_crosshair
-        )
         self.spin_battery_max_level.valueChanged.connect(self.recalculate_time_stats)
         self.spin_battery_min_level.valueChanged.connect(self.recalculate_time_stats)
-        self.spin_sample_rate.valueChanged.connect(self.pyqtgraph_line.redraw_crosshair)
-        self.spin_sample_rate.editingFinished.connect(self.pyqtgraph_line.redraw_crosshair)
+
         self.spin_axis_tick_length.valueChanged.connect(self.adjust_plot_axes_styles)
         self.spin_tick_text_offset.valueChanged.connect(self.adjust_plot_axes_styles)
         self.spin_gridline_opacity.valueChanged.connect(self.update_gridlines)
         self.spin_decimal_places.valueChanged.connect(self.refresh_stats)
         self.spin_decimal_places.valueChanged.connect(self.order_experience_plots)
 
+        # Crosshair spinners emit valueChanged and editingFinished for the same edit, so both
+        # signals share a debounced redraw
+        redraw_crosshair: Callable = qdebounced(
+            lambda *_: self.pyqtgraph_line.redraw_crosshair(), timeout=50, parent=self
+        )
+        for spinner in (self.spin_crosshair_update_rate, self.spin_sample_rate):
+            spinner.valueChanged.connect(redraw_crosshair)
+            spinner.editingFinished.connect(redraw_crosshair)
+
+        # Percentile curves are recalculated through a signal proxy, but the sample count label
+        # follows every change
+        for spinner in (
+            self.spin_percentile_start,
+            self.spin_percentile_end,
+            self.spin_percentile_step,
+        ):
+            spinner.valueChanged.connect(self.update_percentile_label)
+
         # Menu bar actions
         self.menu_file_exit.triggered.connect(self.close)
         self.menu_metadata_remove_properties.triggered.connect(lambda: remove_section("Properties"))
         self.menu_metadata_remove_color.triggered.connect(lambda: remove_section("Color"))
         self.menu_metadata_remove_time.triggered.connect(lambda: remove_section("Time"))
         self.menu_metadata_remove_all.triggered.connect(remove_all_records)
-        self.menu_about_shortcuts.triggered.connect(lambda: HelpShortcutsDialog().exec())
+        self.menu_about_shortcuts.triggered.connect(self.show_shortcuts)
         self.menu_about_github.triggered.connect(
             lambda: open_browser("https://github.com/Dolikhena/Pydra-External")
         )
 
-        # Connect to signal-emitting objects located in other Pydra modules
+        # Dragged curves emit a signal for every cursor movement, so redefining the curve is
+        # throttled to roughly once per frame. Dropping the curve redefines all of its curves.
+        redraw_dragged_line: Callable = qthrottled(
+            self.update_dragged_line_plot, timeout=16, parent=self
+        )
+
+        # Connect to signal-emitting objects located in other Pydra modules. Context menu options
+        # are mapped to their slots once rather than on every emitted signal.
+        self.menu_option_slots: dict[int, Callable] = {
+            MenuOption.ToggleCursor.value: self.toggle_vertical_cursor,
+            MenuOption.PlotDragged.value: redraw_dragged_line,
+            MenuOption.PlotDropped.value: self.update_dropped_line_plot,
+            MenuOption.SelectFile.value: self.curve_was_clicked,
+            MenuOption.ClearFile.value: self.clear_selected_plot,
+            MenuOption.ClearAllFiles.value: self.clear_plots,
+            MenuOption.ModifySelectedFile.value: self.modify_selected_plot,
+            MenuOption.ModifyAllFiles.value: self.modify_all_plots,
+            MenuOption.RefreshPlots.value: self.refresh_plots,
+            MenuOption.ReorderLegend.value: self.reorder_legends,
+            MenuOption.ViewInBrowser.value: self.view_selected_file,
+            MenuOption.ViewProperties.value: self.view_file_properties,
+        }
         ContextSignal.emitter.signal.connect(self.context_menu_signals)
         SquareLegendItem.clicked.signal.connect(self.legend_was_clicked)
         SquareLegendItem.dragged.signal.connect(
@@ -661,6 +679,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         SquareLegendItem.view_file.signal.connect(self.view_selected_file)
         SquareLegendItem.view_properties.signal.connect(self.view_file_properties)
 
+        # Files discovered by folder-walking workers are queued back to the GUI thread
+        self.files_discovered.connect(self.batch_spawn_workers)
+
     @stopwatch(silent=True)
     def connect_signal_proxies(self) -> None:
         """Regulate the frequency of some signals using a proxy.
@@ -672,114 +693,104 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         would lead to wasteful and expensive recalculations, so limiting the signal rates of these
         widgets improves the user experience.
         """
-        if running_from_exe():
-            pyi_splash.update_text("Connecting proxies...")
-
-        signal_batch: tuple
-        self.proxies: list = []
-        proxy = SignalProxy
-        signals_per_second: int = int(setting("Development", "SignalProxyRate"))
-
-        def batch_connections(signals: tuple, slot: Callable) -> list:
-            """Return a batched list of connected signals and slots."""
-            return [
-                proxy(signal.valueChanged, rateLimit=signals_per_second, slot=slot)
-                for signal in signals
-            ]
-
-        # Line plot widgets
-        signal_batch = (self.spin_x_min, self.spin_x_max, self.spin_y_min, self.spin_y_max)
-        self.proxies += batch_connections(signal_batch, lambda: self.change_range("Line"))
-
-        # Percentile plot axis widgets
-        signal_batch = (self.spin_percentiles_y_min, self.spin_percentiles_y_max)
-        self.proxies += batch_connections(signal_batch, lambda: self.change_range("Percentiles"))
-
-        # Percentile plot range/step widgets
-        signal_batch = (
-            self.spin_percentile_start,
-            self.spin_percentile_end,
-            self.spin_percentile_step,
-        )
-        self.proxies += batch_connections(signal_batch, self.update_percentile_steps)
+        splash_message("Connecting proxies...")
 
-        # Percentile plot widgets
-        self.proxies += [
-            SignalProxy(
-                self.spin_histogram_bins.valueChanged,
-                rateLimit=signals_per_second,
-                slot=self.refresh_plots,
-            )
-        ]
+        self.proxy_rate: int = setting_int("Development", "SignalProxyRate")
 
-        # Histogram plot widgets
-        signal_batch = (
-            self.spin_histogram_x_min,
-            self.spin_histogram_x_max,
-            self.spin_histogram_y_min,
-            self.spin_histogram_y_max,
-        )
-        self.proxies += batch_connections(signal_batch, lambda: self.change_range("Histogram"))
-
-        # Box plot widgets
-        signal_batch = (
-            self.spin_box_x_min,
-            self.spin_box_x_max,
-            self.spin_box_y_min,
-            self.spin_box_y_max,
-        )
-        self.proxies += batch_connections(signal_batch, lambda: self.change_range("Box"))
-        signal_batch = (self.spin_box_height, self.spin_box_spacing)
-        self.proxies += batch_connections(signal_batch, lambda: self.order_box_plots())
-
-        # Scatter plot widgets
-        signal_batch = (
-            self.spin_scatter_x_min,
-            self.spin_scatter_x_max,
-            self.spin_scatter_y_min,
-            self.spin_scatter_y_max,
-        )
-        self.proxies += batch_connections(signal_batch, lambda: self.change_range("Scatter"))
-
-        # Experience plot widgets
-        signal_batch = (
-            self.spin_experience_x_min,
-            self.spin_experience_x_max,
-            self.spin_experience_y_min,
-            self.spin_experience_y_max,
-        )
-        self.proxies += batch_connections(signal_batch, lambda: self.change_range("Experience"))
-        signal_batch = (
-            self.spin_experience_callout_size,
-            self.spin_experience_height,
-            self.spin_experience_spacing,
-        )
-        self.proxies += batch_connections(signal_batch, self.order_experience_plots)
-
-        # Stutter parameters
-        signal_batch = (
-            self.spin_stutter_delta_ms,
-            self.spin_stutter_delta_pct,
-            self.spin_stutter_window_size,
-            self.spin_stutter_warn_pct,
-            self.spin_stutter_warn_avg,
-            self.spin_stutter_warn_max,
+        # Spinner widgets whose valueChanged signals share a rate-limited slot
+        proxy_table: tuple[tuple[tuple, Callable], ...] = (
+            # Line plot widgets
+            (
+                (self.spin_x_min, self.spin_x_max, self.spin_y_min, self.spin_y_max),
+                lambda: self.change_range("Line"),
+            ),
+            # Percentile plot axis widgets
+            (
+                (self.spin_percentiles_y_min, self.spin_percentiles_y_max),
+                lambda: self.change_range("Percentiles"),
+            ),
+            # Percentile plot range/step widgets
+            (
+                (self.spin_percentile_start, self.spin_percentile_end, self.spin_percentile_step),
+                self.update_percentile_steps,
+            ),
+            # Histogram plot widgets
+            ((self.spin_histogram_bins,), self.refresh_plots),
+            (
+                (
+                    self.spin_histogram_x_min,
+                    self.spin_histogram_x_max,
+                    self.spin_histogram_y_min,
+                    self.spin_histogram_y_max,
+                ),
+                lambda: self.change_range("Histogram"),
+            ),
+            # Box plot widgets
+            (
+                (
+                    self.spin_box_x_min,
+                    self.spin_box_x_max,
+                    self.spin_box_y_min,
+                    self.spin_box_y_max,
+                ),
+                lambda: self.change_range("Box"),
+            ),
+            ((self.spin_box_height, self.spin_box_spacing), lambda: self.order_box_plots()),
+            # Scatter plot widgets
+            (
+                (
+                    self.spin_scatter_x_min,
+                    self.spin_scatter_x_max,
+                    self.spin_scatter_y_min,
+                    self.spin_scatter_y_max,
+                ),
+                lambda: self.change_range("Scatter"),
+            ),
+            # Experience plot widgets
+            (
+                (
+                    self.spin_experience_x_min,
+                    self.spin_experience_x_max,
+                    self.spin_experience_y_min,
+                    self.spin_experience_y_max,
+                ),
+                lambda: self.change_range("Experience"),
+            ),
+            (
+                (
+                    self.spin_experience_callout_size,
+                    self.spin_experience_height,
+                    self.spin_experience_spacing,
+                ),
+                self.order_experience_plots,
+            ),
+            # Stutter and oscillation parameters
+            (
+                (
+                    self.spin_stutter_delta_ms,
+                    self.spin_stutter_delta_pct,
+                    self.spin_stutter_window_size,
+                    self.spin_stutter_warn_pct,
+                    self.spin_stutter_warn_avg,
+                    self.spin_stutter_warn_max,
+                    self.spin_osc_delta_ms,
+                    self.spin_osc_delta_pct,
+                    self.spin_osc_warn_pct,
+                ),
+                self.update_stutter_parameters,
+            ),
         )
-        self.proxies += batch_connections(signal_batch, self.update_stutter_parameters)
 
-        # Oscillation parameters
-        signal_batch = (
-            self.spin_osc_delta_ms,
-            self.spin_osc_delta_pct,
-            self.spin_osc_warn_pct,
-        )
-        self.proxies += batch_connections(signal_batch, self.update_stutter_parameters)
+        self.proxies: list = [
+            SignalProxy(widget.valueChanged, rateLimit=self.proxy_rate, slot=slot)
+            for widgets, slot in proxy_table
+            for widget in widgets
+        ]
 
     @stopwatch(silent=True)
     def prepare_plots(self) -> None:
         """Define the initial state of the plot widgets."""
-        if running_from_exe():
-            pyi_splash.update_text("Preparing plots...")
+        splash_message("Preparing plots...")
 
         setConfigOptions(
             antialias=(setting("Plotting", "Antialiasing") == "Enabled"),
@@ -800,6 +811,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         for name, widget in self.plots.items():
             widget.set_name(name)  # Simplifies context menu handling
 
+        # Value callouts drawn on the experience plot, which are reused between redraws, along
+        # with the HTML last set on the label in each slot
+        self.experience_labels: list[TextItem] = []
+        self.experience_label_html: list[str] = []
+
         # Associate plot-specific widgets for use in notifying the user when a plot with
         # a clamped axis contains (negative) values that are not visible while clamped.
         self.plot_range_controls = {
@@ -878,47 +894,28 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             },
         }
 
+        # Flattened (plot_name, axis, widgets) entries for slots that visit every axis
+        self.flat_range_controls: tuple[tuple[str, str, tuple], ...] = tuple(
+            (plot_name, axis, widgets)
+            for plot_name, pairs in self.plot_range_controls.items()
+            for axis, widgets in pairs.items()
+        )
+
         # Hide range control widgets (for simplicity)
-        for pairs in self.plot_range_controls.values():
-            for widgets in pairs.values():
-                min_widget, max_widget, _, _ = widgets
-                min_widget.setVisible(False)
-                max_widget.setVisible(False)
-
-        # Route methods that adjust a plot's axes ranges through a signal proxy
-        # Note that slot assignments must be explicit due to the use of lamdbas
-        signals_per_second: int = int(setting("Development", "SignalProxyRate"))
+        for _, _, (min_widget, max_widget, _, _) in self.flat_range_controls:
+            min_widget.setVisible(False)
+            max_widget.setVisible(False)
+
+        # Route methods that adjust a plot's axes ranges through a signal proxy. Every proxy shares
+        # one slot, which identifies the plot from the emitted signal arguments.
+        self.plot_names: dict[ContextMenuPlotWidget, str] = {
+            plot: name for name, plot in self.plots.items()
+        }
         self.proxies += [
             SignalProxy(
-                self.plots["Line"].sigRangeChanged,
-                rateLimit=signals_per_second,
-                slot=lambda: self.update_plot_ranges("Line"),
-            ),
-            SignalProxy(
-                self.plots["Percentiles"].sigRangeChanged,
-                rateLimit=signals_per_second,
-                slot=lambda: self.update_plot_ranges("Percentiles"),
-            ),
-            SignalProxy(
-                self.plots["Histogram"].sigRangeChanged,
-                rateLimit=signals_per_second,
-                slot=lambda: self.update_plot_ranges("Histogram"),
-            ),
-            SignalProxy(
-                self.plots["Box"].sigRangeChanged,
-                rateLimit=signals_per_second,
-                slot=lambda: self.update_plot_ranges("Box"),
-            ),
-            SignalProxy(
-                self.plots["Scatter"].sigRangeChanged,
-                rateLimit=signals_per_second,
-                slot=lambda: self.update_plot_ranges("Scatter"),
-            ),
-            SignalProxy(
-                self.plots["Experience"].sigRangeChanged,
-                rateLimit=signals_per_second,
-                slot=lambda: self.update_plot_ranges("Experience"),
-            ),
+                plot.sigRangeChanged, rateLimit=self.proxy_rate, slot=self.plot_range_changed
+            )
+            for plot in self.plots.values()
         ]
 
         self.functional_widgets: dict[str, tuple] = {
@@ -947,32 +944,53 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         rows within the same column. The associated PlotObject(s), their tooltips, plot titles, and
         legend items will also be updated with the new properties.
         """
-        if running_from_exe():
-            pyi_splash.update_text("Preparing models...")
+        splash_message("Preparing models...")
 
         self.file_filter: dict[str, dict[bool, str]] = {True: {}, False: {}}
+
+        # Encoding and storing the header visibility is deferred so rapid changes coalesce
+        self.persist_metric_visibility: Callable = qdebounced(
+            self.save_metric_visibility, timeout=150, parent=self
+        )
         self.header_visibility: dict[str, bool] = self.update_metric_visibility()
-        self.table_headers: list[str] = stat_table_headers().values()
         self.set_data_source_models()
 
+        # Only measure two rows when sizing file browser columns, which may hold millions of rows
+        self.table_file_browser.horizontalHeader().setResizeContentsPrecision(2)
+
         self.delegate: SignalingDelegate = SignalingDelegate(self.table_stats)
         self.table_stats.setItemDelegate(self.delegate)
-        self.table_stats.cell_edited.connect(self.update_properties)
+        # Queued so the editor closes before the edit propagates to plot titles and legends
+        self.table_stats.cell_edited.connect(
+            self.update_properties, Qt.ConnectionType.QueuedConnection
+        )
+
+        # The stats table is refreshed on every selection and setting change, so measuring the
+        # contents of every cell for column widths is throttled
+        self.resize_stats_columns: Callable = qthrottled(
+            self.table_stats.resizeColumnsToContents, timeout=200, parent=self
+        )
 
     @stopwatch(silent=True)
     def register_resources(self) -> None:
         """Fetch and register icons, fonts, and style sheets used in the GUI."""
-        if running_from_exe():
-            pyi_splash.update_text("Registering resources...")
-
-        self.integrity_icon: dict[str, object] = {
-            "Initialized": icon_path("integrity-pending.png"),
-            "Pending": icon_path("integrity-pending.png"),
-            "Ideal": icon_path("integrity-ideal.png"),
-            "Dirty": icon_path("integrity-dirty.png"),
-            "Partial": icon_path("integrity-partial.png"),
-            "Mangled": icon_path("integrity-mangled.png"),
-            "Invalid": icon_path("integrity-invalid.png"),
+        splash_message("Registering resources...")
+
+        # Each icon file is loaded once; integrities sharing a file share the same QIcon instance.
+        # Every integrity is mapped (falling back to the invalid icon), so lookups never miss.
+        icon_names: dict[str, str] = {
+            "Initialized": "pending",
+            "Pending": "pending",
+            "Ideal": "ideal",
+            "Dirty": "dirty",
+            "Partial": "partial",
+            "Mangled": "mangled",
+        }
+        self.integrity_icon: dict[str, QIcon] = {
+            integrity.name: icon_path(
+                f"integrity-{icon_names.get(integrity.name, 'invalid')}.png"
+            )
+            for integrity in Integrity
         }
 
         use_dark_mode: bool = setting_bool("General", "UseDarkStylesheet")
@@ -981,29 +999,38 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         self.setWindowIcon(icon_path("pydra.ico"))
         self.apply_stylesheet(use_dark_mode)
-        self.table_stats.resizeColumnsToContents()  # Resize after applying CSS
+        # Measuring every cell is deferred until after the window is shown
+        QTimer.singleShot(0, self.table_stats.resizeColumnsToContents)  # Resize after applying CSS
         self.btn_toggle_css.setChecked(use_dark_mode)
 
     @stopwatch(silent=True)
     def prepare_dialogs(self) -> None:
         """Define native file explorers and dialog window objects."""
-        if running_from_exe():
-            pyi_splash.update_text("Preparing dialogues...")
+        splash_message("Preparing dialogues...")
 
-        self.file_extensions: tuple = (".csv", ".hml", ".txt")
+        self.file_extensions: frozenset = frozenset({".csv", ".hml", ".txt"})
         self.native_explorer_path: Path = Path(getenv("WINDIR")).joinpath("explorer.exe")
 
         self.file_dialog: QFileDialog = QFileDialog(self)
         self.metrics_dialog: QDialog = StatMetricsDialog(self)
+        self.shortcuts_dialog: Optional[QDialog] = None
+        self.properties_dialog: Optional[FilePropertyDialog] = None
         self.header_visibility: dict = {}
 
+    @pyqtSlot()
+    def show_shortcuts(self) -> None:
+        """Show the keyboard shortcuts dialog, building it the first time it is requested."""
+        if self.shortcuts_dialog is None:
+            self.shortcuts_dialog = HelpShortcutsDialog(self)
+        self.shortcuts_dialog.exec()
+
     @stopwatch(silent=True)
     def register_shortcuts(self) -> None:
         """Define key combinations and their associated functions."""
         line_vb = self.plots["Line"].viewbox
 
         # General UI
-        QShortcut("F1", self).activated.connect(lambda: HelpShortcutsDialog().exec())
+        QShortcut("F1", self).activated.connect(self.show_shortcuts)
         QShortcut("Ctrl+S", self).activated.connect(self.export_current_view)
 
         # Plot items
@@ -1028,22 +1055,32 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     @stopwatch(silent=True)
     def schedule_events(self) -> None:
         """Update labels for the number of busy I/O threads and current working set (memory usage)."""
-        if running_from_exe():
-            pyi_splash.update_text("Scheduling events...")
+        splash_message("Scheduling events...")
 
         self.process_mem_info: Callable = Process(getpid()).memory_info
         self.memalloc_tracker: Welford = Welford()
+        self.last_mem_alloc: float = 0.0
+        self.last_active_threads: int = -1
+        self.last_mem_alloc_text: str = ""
+        self.last_worker_threads_text: str = ""
 
         self.timer: QTimer = QTimer()
         self.timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
         self.timer.start(1000)
         self.timer.timeout.connect(self.update_activity_labels)
 
+        # Poll less frequently while the application is in the background
+        QApplication.instance().applicationStateChanged.connect(self.adjust_activity_interval)
+
+    @pyqtSlot(Qt.ApplicationState)
+    def adjust_activity_interval(self, state: Qt.ApplicationState) -> None:
+        """Slow the activity label updates to every five seconds while the app is inactive."""
+        self.timer.setInterval(1000 if state == Qt.ApplicationState.ApplicationActive else 5000)
+
     @stopwatch(silent=True)
     def check_for_updates(self) -> None:
         """Check for updates and display a message if a newer version is available."""
-        if running_from_exe():
-            pyi_splash.update_text("Checking for updates...")
+        splash_message("Checking for updates...")
 
         def notify_of_update(results: tuple[bool, bool]) -> None:
             """Notify of a new version and ask to default the config settings."""
@@ -1071,11 +1108,21 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
                 set_value("General", "Version", current_version_str())
 
-        # Run on separate thread to avoid blocking the GUI
-        worker = Worker(update_available)
-        worker.signals.error.connect(lambda x: log_exception(logger, x))
-        worker.signals.result.connect(notify_of_update)
-        self.pool.start(worker.work)
+        def read_version_reply() -> None:
+            """Compare the downloaded version file against the current version."""
+            remote_version_file: str = ""
+            if reply.error() == QNetworkReply.NetworkError.NoError:
+                remote_version_file = bytes(reply.readAll()).decode("utf-8")
+            else:
+                logger.error(f"Could not establish connection to GitHub: {reply.errorString()}")
+
+            reply.deleteLater()
+            notify_of_update(update_available(remote_version_file))
+
+        # Request asynchronously to avoid blocking the GUI or occupying an I/O thread
+        self.network_manager: QNetworkAccessManager = QNetworkAccessManager(self)
+        reply: QNetworkReply = self.network_manager.get(version_file_request())
+        reply.finished.connect(read_version_reply)
 
     def report_memalloc_stats(self) -> None:
         """Report simple memory allocation statistics when the window is closed."""
@@ -1095,9 +1142,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         tick_length: int = self.spin_axis_tick_length.value()
         tick_text_offset: int = self.spin_tick_text_offset.value()
 
+        # Avoid restyling (and relaying out) every axis when the values have not changed
+        if (tick_length, tick_text_offset) == self.last_axis_style:
+            return
+        self.last_axis_style = (tick_length, tick_text_offset)
+
         for plot in self.plots.values():
-            bottom = plot.getAxis("bottom")
-            left = plot.getAxis("left")
+            bottom = plot.bottom_axis
+            left = plot.left_axis
 
             bottom.enableAutoSIPrefix(enable=False)
             bottom.setStyle(
@@ -1123,28 +1175,15 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         Args:
             * signal_value: Value corresponding to Option enum value.
         """
-        signal_mapped_func: dict = {
-            MenuOption.ToggleCursor.value: self.toggle_vertical_cursor,
-            MenuOption.PlotDragged.value: self.update_dragged_line_plot,
-            MenuOption.PlotDropped.value: self.update_dropped_line_plot,
-            MenuOption.SelectFile.value: self.curve_was_clicked,
-            MenuOption.ClearFile.value: self.clear_selected_plot,
-            MenuOption.ClearAllFiles.value: self.clear_plots,
-            MenuOption.ModifySelectedFile.value: self.modify_selected_plot,
-            MenuOption.ModifyAllFiles.value: self.modify_all_plots,
-            MenuOption.RefreshPlots.value: self.refresh_plots,
-            MenuOption.ReorderLegend.value: self.reorder_legends,
-            MenuOption.ViewInBrowser.value: self.view_selected_file,
-            MenuOption.ViewProperties.value: self.view_file_properties,
-        }.get(signal_value)
-        return signal_mapped_func()
+        if (signal_mapped_func := self.menu_option_slots.get(signal_value)) is not None:
+            return signal_mapped_func()
 
     @pyqtSlot(int)
     def changed_current_tab(self, idx: int) -> None:
         """Update current tab index and force specific plots to auto-range on first viewing."""
         set_session_value("CurrentTabIndex", idx)
 
-        if idx == Tab.Experience.value:
+        if idx == _TAB_EXPERIENCE:
             self.pyqtgraph_experience.force_autorange()
 
     @pyqtSlot(tuple)
@@ -1169,6 +1208,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         else:
             self.plots["Line"].hide_crosshair()
 
+    @pyqtSlot()
     def update_activity_labels(self) -> None:
         """Update GUI labels with the number of active I/O threads and current working set.
 
@@ -1177,15 +1217,33 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """
         # Memory allocation updates
         current_mem_alloc: float = self.process_mem_info().wset
-        readable_mem_alloc: str = size_from_bytes(current_mem_alloc)
-
         self.memalloc_tracker.update(current_mem_alloc)
-        self.label_mem_alloc.setText(f"<b>Working Set:</b> {readable_mem_alloc}")
+
+        # Skip label updates unless memory usage changed by at least 1% or threads were started
+        # or finished since the last update
+        active_threads: int = self.pool.activeThreadCount()
+        if (
+            active_threads == self.last_active_threads
+            and abs(current_mem_alloc - self.last_mem_alloc) < self.last_mem_alloc * 0.01
+        ):
+            return
+
+        self.last_mem_alloc = current_mem_alloc
+        self.last_active_threads = active_threads
+
+        # Only replace label text when it changes to avoid re-parsing rich text every tick
+        mem_alloc_text: str = f"<b>Working Set:</b> {size_from_bytes(current_mem_alloc)}"
+        if mem_alloc_text != self.last_mem_alloc_text:
+            self.label_mem_alloc.setText(mem_alloc_text)
+            self.last_mem_alloc_text = mem_alloc_text
 
         # Worker thread updates
-        self.label_worker_threads.setText(
-            f"<b>Active Threads:</b> {self.pool.activeThreadCount()} / {self.pool.maxThreadCount()}"
+        worker_threads_text: str = (
+            f"<b>Active Threads:</b> {active_threads} / {self.pool.maxThreadCount()}"
         )
+        if worker_threads_text != self.last_worker_threads_text:
+            self.label_worker_threads.setText(worker_threads_text)
+            self.last_worker_threads_text = worker_threads_text
 
     @pyqtSlot(QDragEnterEvent)
     def dragEnterEvent(self, drag_event: QDragEnterEvent) -> None:
@@ -1196,7 +1254,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         if drag_event.mimeData().hasUrls():
             drag_event.accept()
         else:
-            logger.info("Drag enter event was refused (remote, bad, or empty reference)")
+            # Log refused drags at most once per second
+            now: int = perf_counter_ns()
+            if logger.isEnabledFor(INFO) and now - self.last_refused_drag_log > 1_000_000_000:
+                logger.info("Drag enter event was refused (remote, bad, or empty reference)")
+                self.last_refused_drag_log = now
             drag_event.ignore()
 
     @pyqtSlot(QDropEvent)
@@ -1229,44 +1291,93 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             )
 
         if num_folders > 0:
-            all_files = self.walk_through_directory(dropped_folders)
+            return self.import_folders(dropped_folders, all_files)
 
         self.batch_spawn_workers(all_files)
 
-    def walk_through_directory(self, dropped_folders: list) -> list:
-        """Discover nested files within a dropped directory."""
-        all_files: list[str] = []
-        # all_directories: list[str] = []
-        num_folders: int = 0
-        # root_depth: int = 0
-        # root_dict: dict = {}
-        # dir_level: int = 0
+    def import_folders(self, folders: list, loose_files: tuple = ()) -> None:
+        """Discover files within folders on a worker thread and import them as they are found.
+
+        Discovered files are streamed back to the GUI thread in batches through the
+        `files_discovered` signal, so file reads begin before the walk has finished.
+        """
+        if loose_files:
+            self.batch_spawn_workers(list(loose_files))
+
+        def report_discovered_files(num_discovered: int) -> None:
+            """Post the number of files found once the walk has finished."""
+            if (num_files := num_discovered + len(loose_files)) > 0:
+                StatusBarWithQueue.post(
+                    f"Importing {num_files} file{'s' if num_files > 1 else ''}..."
+                )
+            else:
+                logger.info("No files were passed to workers")
 
-        for folder in dropped_folders:
-            # root_depth = len(Path(folder).parents)
-            for root, dirs, files in walk(folder):
-                root = Path(root)
+        # The walk counts as an active worker so that progress isn't reset between batches
+        worker = Worker(self.walk_through_directory, folders)
+        worker.signals.error.connect(lambda x: log_exception(logger, x))
+        worker.signals.result.connect(report_discovered_files)
+        worker.signals.finished.connect(lambda _: self.worker_finished(0))
+        self.active_workers += 1
+        self.pool.start(worker.work)
 
-                # dir_level = len(root.parents) - root_depth
-                # if dirs:
-                #     root_dict[dir_level] = dirs
+    def walk_through_directory(self, dropped_folders: list) -> int:
+        """Discover nested files within a dropped directory.
 
-                num_folders += len(dirs)
-                all_files += [
-                    root / file
-                    for file in files
-                    if Path(file).suffix.lower() in self.file_extensions
-                ]
+        Folders are traversed iteratively with `scandir`, whose entries cache their file type and
+        avoid building a path object for every file that is encountered. Matching files are
+        emitted in batches through `files_discovered` along with their combined size (read from
+        the entry's stat cache where the platform provides one), and the total number of files is
+        returned.
+        """
+        batch: list[Path] = []
+        batch_bytes: int = 0
+        num_files: int = 0
+        num_folders: int = 0
+        pending_folders: list = [str(folder) for folder in dropped_folders]
 
-        # for k, v in root_dict.items():
-        #     print(f"{k}: {v}")
+        while pending_folders:
+            try:
+                with scandir(pending_folders.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending_folders.append(entry.path)
+                                num_folders += 1
+                            elif splitext(entry.name)[1].lower() in self.file_extensions:
+                                if entry.is_file():
+                                    batch.append(Path(entry.path))
+                                    batch_bytes += self.entry_size(entry)
+                        except OSError as e:
+                            # Only skip the offending entry rather than the rest of its folder
+                            logger.debug(f"Skipped unreadable entry: {e}")
+            except OSError as e:
+                logger.debug(f"Skipped unreadable folder: {e}")
+
+            if len(batch) >= _DISCOVERY_BATCH_SIZE or (batch and not pending_folders):
+                num_files += len(batch)
+                self.files_discovered.emit(batch, batch_bytes)
+                batch = []
+                batch_bytes = 0
 
         logger.debug(
-            f"Imported {len(all_files):,} total files in "
+            f"Imported {num_files:,} total files in "
             f"{num_folders:,} folder{'s' if num_folders else ''}"
         )
 
-        return all_files
+        return num_files
+
+    @staticmethod
+    def entry_size(entry: DirEntry) -> int:
+        """Return the size of a directory entry in bytes, or 0 if it cannot be read.
+
+        Args:
+            * entry (DirEntry): Directory entry yielded by `scandir`.
+        """
+        try:
+            return entry.stat().st_size
+        except OSError:
+            return 0
 
     @pyqtSlot(str)
     def update_legend_labels(self, widget_text: str = "") -> None:
@@ -1285,8 +1396,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             SquareLegendItem.update_all()
 
         # Update plots where legend items are used for the axes
-        self.order_box_plots(axis_only=True)
-        self.order_experience_plots()
+        self.order_bar_plots(axis_only=True)
 
     @pyqtSlot(str)
     def change_file_list_format(self, fmt: str) -> None:
@@ -1317,8 +1427,12 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             update_record(plot_obj.file.hash, plot_obj.file.properties)
             self.update_file_icon(file_path, plot_obj.file.integrity)  # Update tooltips
 
-            self.update_legend_labels()
-            self.translate_plot_titles()
+            # Only retranslate legends and titles whose format references the edited property
+            property_tag: str = f"[{property_name}]"
+            if property_tag in setting("Plotting", "LegendItemFormat"):
+                self.update_legend_labels()
+            if property_tag in self.line_main_title.text():
+                self.translate_plot_titles()
         except Exception as e:
             logger.error(f"Failed to set {property_name} to {new_value} for {file_path}")
             log_exception(logger, e)
@@ -1329,27 +1443,40 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """Return a list of properties for all currently plotted files."""
         return [v.file.properties for v in PlotObject.plotted_values()]
 
-    def common_properties(self, property_name: str) -> str:
+    def common_properties(self, file_properties: list, *property_names: str) -> dict[str, str]:
         """Find common properties shared between plotted captures for use with plot titles.
 
+        All properties are resolved in a single pass over the files, which ends early once every
+        property has been found to differ between files.
+
         Args:
-            * property_name (str): Key to search from a PlotObject's file properties.
+            * file_properties (list): File properties of the plotted files.
+            * property_names (str): Keys to search from a PlotObject's file properties.
 
         Returns:
-            * str: Name of the common property (or a suitable fallback) for all plotted files.
+            * dict[str, str]: Name of the common property (or a suitable fallback) for all plotted
+            files, keyed by property name.
         """
-        common_property: str = ""
-
-        for file in self.plotted_file_properties():
-            if not common_property:
-                common_property = file[property_name]
-            elif common_property != file[property_name]:
-                common_property = (
-                    f"Different {property_name}{'s' if property_name[-1] != 's' else ''}"
-                )
+        common: dict[str, str] = dict.fromkeys(property_names, "")
+        different: set[str] = set()
+
+        for file in file_properties:
+            for name in property_names:
+                if name in different:
+                    continue
+                if not common[name]:
+                    common[name] = file[name]
+                elif common[name] != file[name]:
+                    common[name] = f"Different {name}{'s' if name[-1] != 's' else ''}"
+                    different.add(name)
+
+            if len(different) == len(property_names):
                 break
 
-        return common_property if common_property != "Unknown" else f"Unknown {property_name}"
+        return {
+            name: value if value != "Unknown" else f"Unknown {name}"
+            for name, value in common.items()
+        }
 
     @pyqtSlot()
     def translate_plot_titles(self, fmt: str = "") -> None:
@@ -1366,50 +1493,52 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         title_format: str
         title_tags: dict[str, str] = {}
 
-        if len(self.plotted_file_properties()) == 0:
+        file_properties: list = self.plotted_file_properties()
+        primary_source: str = session("PrimaryDataSource")
+
+        if len(file_properties) == 0:
             title_format = "[PlotType]"
         else:
             title_format = fmt or self.line_main_title.text()
-            title_tags = {
-                "[Application]": self.common_properties("Application"),
-                "[Resolution]": self.common_properties("Resolution"),
-                "[Runtime]": self.common_properties("Runtime"),
-                "[GPU]": self.common_properties("GPU"),
-                "[PlotType]": "",
-                "[DataSource]": session("PrimaryDataSource"),
-                # TODO: Modify to support additional axes
-            }
-            scatter_data_sources: str = (
-                f"{session('PrimaryDataSource')} / {session('SecondaryDataSource')}"
+            title_tags = self.common_properties(
+                file_properties, "Application", "Resolution", "Runtime", "GPU"
             )
+            # TODO: Modify to support additional axes
 
-        translated_title: str
+        # Plots that deviate from their own name and the primary data source in their titles
+        plot_tags: dict[str, dict[str, str]] = {
+            "Scatter": {"DataSource": f"{primary_source} / {session('SecondaryDataSource')}"},
+            "Experience": {"PlotType": "Gameplay Experience", "DataSource": "FPS/Latency"},
+        }
+
+        template: str = _title_template(title_format)
         title_font_size: int = self.spin_main_title_size.value()
         opening_tag: str = f"<span style='font-size:{title_font_size}pt;'>"
 
         for plot, widget in self.plots.items():
-            translated_title = title_format
-            title_tags["[PlotType]"] = plot
-
-            for key, value in title_tags.items():
-                if key == "[DataSource]":
-                    if plot == "Scatter":
-                        value = scatter_data_sources
-                    elif plot == "Experience":
-                        value = "FPS/Latency"
-                elif key == "[PlotType]" and plot == "Experience":
-                    value = "Gameplay Experience"
-                translated_title = translated_title.replace(key, value)
-
-            widget.setTitle(f"{opening_tag}{translated_title}</span>")
+            tags: defaultdict[str, str] = defaultdict(
+                str, title_tags, PlotType=plot, DataSource=primary_source
+            )
+            tags.update(plot_tags.get(plot, {}))
+            widget.setTitle(f"{opening_tag}{template.format_map(tags)}</span>")
 
     def plot_axis_style(self) -> dict[str, str]:
-        """Return a consistent stylization for plot axis labels based on the current stylesheet."""
+        """Return a consistent stylization for plot axis labels based on the current stylesheet.
+
+        The style is rebuilt only after dark mode or the axis label size has changed, and the same
+        dict is returned otherwise, so callers must not modify it.
+        """
+        dark_mode: bool = session("DarkMode")
         font_size: int = self.spin_axis_label_size.value()
-        return {
-            "color": f"#{'c0c0c0' if session('DarkMode') else '000'}",
-            "font-size": f"{font_size}pt",
-        }
+
+        style_key, style = self.axis_label_style
+        if style_key != (dark_mode, font_size):
+            style = {
+                "color": f"#{'c0c0c0' if dark_mode else '000'}",
+                "font-size": f"{font_size}pt",
+            }
+            self.axis_label_style = ((dark_mode, font_size), style)
+        return style
 
     def update_line_plot_scale(self, style: dict[str, str] = None) -> None:
         """Modify the line plot scale and axis labels in response to the selected time scale.
@@ -1418,10 +1547,12 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             * style (dict[str, str], optional): CSS rules for styling the line edit widget.
         """
         style = style or self.plot_axis_style()
-        self.plots["Line"].getAxis("bottom").setScale(1 / time_scale())
-        self.plots["Line"].getAxis("bottom").setLabel(f"Elapsed Time {time_str_long()}", **style)
-        self.plots["Line"].getAxis("left").setLabel(session("PrimaryDataSource"), **style)
+        line_plot: ContextMenuPlotWidget = self.plots["Line"]
+        line_plot.bottom_axis.setScale(1 / time_scale())
+        line_plot.bottom_axis.setLabel(f"Elapsed Time {time_str_long()}", **style)
+        line_plot.left_axis.setLabel(session("PrimaryDataSource"), **style)
 
+    @pyqtSlot()
     def update_gridlines(self) -> None:
         """Show, hide, or modify the opacity of gridlines on the plots."""
         for plot in self.plots.values():
@@ -1439,7 +1570,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         primary_source: str = session("PrimaryDataSource")
         secondary_source: str = session("SecondaryDataSource") or primary_source
         font: QFont = QFontDatabase.font("Open Sans", "Regular", 0)
-        font.setPixelSize(int(setting("Plotting", "AxisLabelFontSize")) + 3)
+        font.setPixelSize(setting_int("Plotting", "AxisLabelFontSize") + 3)
 
         x_axis_label: dict[str, str] = {
             # Line plot labels are handled via `update_line_plot_scale()`
@@ -1459,42 +1590,56 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             "Experience": None,
         }
 
-        for name, plot in self.plots.items():
-            plot.getAxis("bottom").setStyle(tickFont=font)
-            plot.getAxis("left").setStyle(tickFont=font)
-
-            if name == "Line":
-                self.update_line_plot_scale(style)
-                continue
+        # Defer plot repaints until every axis has been restyled and relabeled
+        self.view_tabs.setUpdatesEnabled(False)
+        try:
+            for name, plot in self.plots.items():
+                bottom_axis = plot.bottom_axis
+                left_axis = plot.left_axis
+                bottom_axis.setStyle(tickFont=font)
+                left_axis.setStyle(tickFont=font)
+
+                if name == "Line":
+                    self.update_line_plot_scale(style)
+                    continue
 
-            plot.getAxis("bottom").setLabel(x_axis_label[name], **style)
-            plot.getAxis("left").setLabel(y_axis_label[name], **style)
+                bottom_axis.setLabel(x_axis_label[name], **style)
+                left_axis.setLabel(y_axis_label[name], **style)
 
-            # Histogram plot shows relative distribution, so the scale will always be 100x.
-            plot.getAxis("left").setScale(100 if name == "Histogram" else 1)
+                # Histogram plot shows relative distribution, so the scale will always be 100x.
+                left_axis.setScale(100 if name == "Histogram" else 1)
+        finally:
+            self.view_tabs.setUpdatesEnabled(True)
 
     def set_plot_color_scheme(self) -> None:
         """Apply a light or dark color scheme to all pyqtgraph plots."""
         dark_mode: bool = session("DarkMode")
 
-        bg_color: tuple = (32, 32, 32) if dark_mode else (255, 255, 255)
-        axis_color: tuple = (192, 192, 192) if dark_mode else (0, 0, 0)
+        # Build the color and pen once so every plot and axis shares the same objects
+        bg_color: QColor = mkColor((32, 32, 32) if dark_mode else (255, 255, 255))
+        axis_pen: QPen = mkPen((192, 192, 192) if dark_mode else (0, 0, 0))
 
         for plot in self.plots.values():
             plot.setBackground(background=bg_color)
 
-            get_axis = plot.getAxis
-            for axis in ("bottom", "left"):
-                ax = get_axis(axis)
-                ax.setPen(axis_color)
-                ax.setTextPen(axis_color)
+            for ax in (plot.bottom_axis, plot.left_axis):
+                ax.setPen(axis_pen)
+                ax.setTextPen(axis_pen)
 
     @pyqtSlot(bool)
     def apply_stylesheet(self, dark_mode: bool = False) -> None:
-        """Change the current style sheet to light/dark mode."""
+        """Change the current style sheet to light/dark mode.
+
+        Restyling the widget tree is expensive, so nothing is reapplied if the style sheet matches
+        the one already in use.
+        """
         set_value("General", "UseDarkStylesheet", dark_mode)
         set_session_value("DarkMode", dark_mode)
-        self.setStyleSheet(current_stylesheet())
+
+        if (stylesheet := current_stylesheet()) == self.last_stylesheet:
+            return
+        self.last_stylesheet = stylesheet
+        self.setStyleSheet(stylesheet)
 
         self.set_plot_color_scheme()
         SquareLegendItem.style_backgrounds()
@@ -1504,6 +1649,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.warn_of_negative_values()
         self.warn_of_expression_error()
 
+    @pyqtSlot()
     def prompt_for_config_reset(self) -> None:
         """Prompt user with a yes/no dialog box to restore the default configuration values."""
         user_response = QMessageBox.information(
@@ -1526,7 +1672,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         the multiplotting feature.
         """
         self.btn_multiplot_settings.setVisible(False)  # Hide until MultiAxisPlotWidget is accepted
-        self.controls_scatter_data.setVisible(tab_index == Tab.Scatter.value)
+        self.controls_scatter_data.setVisible(tab_index == _TAB_SCATTER)
 
     def reset_config_settings(self) -> None:
         """Reset the configuration file to default settings and update widgets accordingly."""
@@ -1538,6 +1684,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.update_percentile_steps()
         self.update_metric_visibility()
 
+    @pyqtSlot()
     def reset_legend_position(self) -> None:
         """Return the plot legends to their default position (top-right corner)."""
         for plot in self.plots.values():
@@ -1548,8 +1695,15 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """Copy each `logger.emit()` and redirect it to the debug log text field."""
         self.text_log.appendPlainText(msg)
 
-    def batch_spawn_workers(self, file_list: list[Path]) -> None:
-        """Spin up workers for each file that was passed in."""
+    @pyqtSlot(list, object)
+    def batch_spawn_workers(self, file_list: list[Path], total_size: Optional[int] = None) -> None:
+        """Spin up workers for each file that was passed in.
+
+        Args:
+            * file_list (list[Path]): Files to be read.
+            * total_size (int, optional): Combined size of the files in bytes. If not provided, the
+            files are measured on a worker thread instead of the GUI thread.
+        """
         if (num_files := len(file_list)) == 0:
             logger.info("No files were passed to workers")
             return
@@ -1560,58 +1714,84 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         self.setCursor(Qt.CursorShape.BusyCursor)
         set_session_value("BusyCursor", True)
+        self.batch_in_progress = True
+
+        # Track how long it takes to load all of the selected files. Files streamed in while a
+        # batch is still being processed are counted towards the same batch.
+        if self.batch_time == 0:
+            self.batch_time = perf_counter_ns()
+        self.batch_count += num_files
+        if total_size is None:
+            worker = Worker(_total_file_size, file_list)
+            worker.signals.error.connect(lambda x: log_exception(logger, x))
+            worker.signals.result.connect(self.add_batch_size)
+            self.pool.start(worker.work)
+        else:
+            self.batch_size += total_size
 
-        # Track how long it takes to load all of the selected files
-        self.batch_count = num_files
-        self.batch_size = sum(f.stat().st_size for f in file_list)
-        self.batch_time = perf_counter_ns()
+        loaded_keys: set[str] = set(PlotObject.all_keys())
+        loaded_files: list[Path] = [f for f in file_list if str(f) in loaded_keys]
+        unloaded_files: list[Path] = [f for f in file_list if str(f) not in loaded_keys]
 
-        for file in file_list:
+        # Files are read in chunks, so each worker reports its results and progress only once
+        chunk_size: int = max(1, len(unloaded_files) // (self.pool.maxThreadCount() * 4))
+        for start in range(0, len(unloaded_files), chunk_size):
             try:
-                self.spawn_worker(file)
+                self.spawn_worker(unloaded_files[start : start + chunk_size])
             except Exception as e:
                 log_exception(logger, e, "Failed to create worker for target")
 
-    def spawn_worker(self, file_path: Path) -> None:
-        """Spin up a worker on a separate thread to read a file."""
-        loaded: bool = str(file_path) in PlotObject.all_keys()
-        if file_path.is_file() and not loaded:
-            worker = Worker(self.create_plot_obj, file_path)
-            worker.signals.error.connect(lambda x: log_exception(logger, x))
-            worker.signals.result.connect(self.add_file_to_models)
-            worker.signals.finished.connect(self.update_progress_bar)
-            return self.pool.start(worker.work)
+        for file in loaded_files:
+            logger.info(f"'{file}' is already loaded")
+            self.update_progress_bar()
+
+    @pyqtSlot(object)
+    def add_batch_size(self, total_size: int) -> None:
+        """Count file sizes measured on a worker thread towards the batch still being processed."""
+        if self.batch_time != 0:
+            self.batch_size += total_size
+
+    def spawn_worker(self, file_paths: list[Path]) -> None:
+        """Spin up a worker on a separate thread to read a chunk of files."""
+        num_files: int = len(file_paths)
+        worker = Worker(self.create_plot_objs, file_paths)
+        worker.signals.error.connect(lambda x: log_exception(logger, x))
+        worker.signals.result.connect(self.add_files_to_models)
+        worker.signals.finished.connect(lambda _: self.worker_finished(num_files))
+        self.active_workers += 1
+        self.pool.start(worker.work)
 
-        if loaded:
-            logger.info(f"'{file_path}' is already loaded")
-        elif not file_path.is_file():
-            logger.error(f"Invalid path received for {file_path}")
-        self.update_progress_bar()
+    def worker_finished(self, num_files: int) -> None:
+        """Stop counting a finished import worker and advance the progress bar."""
+        self.active_workers -= 1
+        self.update_progress_bar(num_files)
 
     def report_batch_processing_time(self) -> None:
         """When all files have been processed, log the time, total size, and approximate I/O rate."""
-        self.batch_time = perf_counter_ns() - self.batch_time
-        batch_rate: float = (self.batch_size / self.batch_time) * 1000
-        logger.debug(
-            f"Processed {self.batch_count} files totaling {size_from_bytes(self.batch_size)} "
-            f"in {time_from_ns(self.batch_time)} "
-            f"({batch_rate:.1f} MB/s)"
-        )
+        if logger.isEnabledFor(DEBUG):
+            self.batch_time = perf_counter_ns() - self.batch_time
+            batch_rate: float = (self.batch_size / self.batch_time) * 1000
+            logger.debug(
+                f"Processed {self.batch_count} files totaling {size_from_bytes(self.batch_size)} "
+                f"in {time_from_ns(self.batch_time)} ({batch_rate:.1f} MB/s)"
+            )
         self.batch_count = self.batch_size = self.batch_time = 0
 
-    @pyqtSlot(bool)
-    def update_progress_bar(self) -> None:
+    def update_progress_bar(self, steps: int = 1) -> None:
         """Increment the GUI progress bar or reset it one second after reaching the max value."""
-        self.progressbar_main.setValue(self.progressbar_main.value() + 1)
+        self.progressbar_main.setValue(self.progressbar_main.value() + steps)
 
         # Reset the progress bar after one second if all work has been completed or if the active
         # I/O thread count is zero (to prevent stalled progress from failed file reads)
         maximum_reached: bool = self.progressbar_main.value() >= self.progressbar_main.maximum()
-        no_active_threads: bool = self.pool.activeThreadCount() == 0
+        no_active_threads: bool = self.active_workers == 0
 
         if maximum_reached or no_active_threads:
             if self.batch_time != 0:
                 self.report_batch_processing_time()
+            if self.batch_in_progress:
+                self.batch_in_progress = False
+                self.update_combo_models()
 
             QTimer.singleShot(1000, self.reset_progress_bar)
 
@@ -1695,34 +1875,46 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             return
 
         set_value("General", "LastUsedPath", folder_path)
-        all_files: list = self.walk_through_directory([folder_path])
-        num_files: int = len(all_files)
-
-        if num_files > 0:
-            StatusBarWithQueue.post(f"Importing {num_files} file{'s' if num_files > 1 else ''}...")
-
-        self.batch_spawn_workers(all_files)
+        self.import_folders([folder_path])
 
+    @pyqtSlot()
     def change_export_path(self) -> None:
         """Open a folder dialog window for the user to select the new output path."""
         folder_path = self.launch_folder_explorer(self.base_path)
         self.line_exporting_path.setText(folder_path)
 
+    @pyqtSlot()
     def change_logging_path(self) -> None:
         """Open a folder dialog window for the user to select the new logging path."""
         folder_path = self.launch_folder_explorer(self.base_path)
         self.line_logging_path.setText(folder_path)
 
-    def create_plot_obj(self, file_path: Path) -> PlotObject:
-        """Worker task for creating a PlotObject on a non-GUI thread."""
-        return PlotObject(file_path, self.integrity_update_event)
+    def create_plot_objs(self, file_paths: list[Path]) -> list[PlotObject]:
+        """Worker task for creating PlotObjects from a chunk of files on a non-GUI thread.
+
+        Files that cannot be read are logged and skipped without affecting the rest of the chunk.
+        """
+        plot_objs: list[PlotObject] = []
+        for file_path in file_paths:
+            if not file_path.is_file():
+                logger.error(f"Invalid path received for {file_path}")
+                continue
+
+            try:
+                plot_objs.append(PlotObject(file_path, self.integrity_update_event))
+            except Exception as e:
+                log_exception(logger, e)
+        return plot_objs
 
     def update_file_icon(self, file_path: Path, file_integrity: Integrity) -> None:
         """Update the integrity icon next to each loaded file in `list_loaded_files`."""
+        if self.pending_list_items:
+            self.flush_list_items()
+
         self.list_loaded_files.update_icon(
             file_path,
             file_integrity,
-            self.integrity_icon.get(file_integrity.name, file_integrity.Invalid.name),
+            self.integrity_icon[file_integrity.name],
         )
 
     @pyqtSlot(tuple)
@@ -1734,45 +1926,77 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """
         try:
             file_path, file_integrity = path_and_integrity
-            new_item: bool = self.list_loaded_files.item_by_path(file_path) is None
+            icon: QIcon = self.integrity_icon[file_integrity.name]
 
-            if new_item:
+            if (pending_row := self.pending_list_items.get(file_path)) is not None:
+                pending_row.setIcon(icon)
+                pending_row.setToolTip(file_integrity.description())
+            elif self.list_loaded_files.item_by_path(file_path) is None:
                 new_row = FlexibleListItem(file_path)
-                new_row.setIcon(
-                    self.integrity_icon.get(file_integrity.name, file_integrity.Invalid.name)
-                )
+                new_row.setIcon(icon)
                 new_row.setToolTip(file_integrity.description())
                 new_row.setFlags(Qt.ItemFlag.NoItemFlags)
-                self.list_loaded_files.addItem(new_row)
+
+                # New rows are buffered briefly so that a burst of files is added in one repaint
+                if not self.pending_list_items:
+                    QTimer.singleShot(16, self.flush_list_items)
+                self.pending_list_items[file_path] = new_row
             else:
                 self.update_file_icon(file_path, file_integrity)
         except Exception as e:
             log_exception(logger, e, "Integrity update callback failed")
 
-    @pyqtSlot(PlotObject)
-    def add_file_to_models(self, plot_obj: PlotObject) -> None:
-        """Invoke a file's first integrity update and add its path to the browser model."""
-        try:
-            file_path: Path = plot_obj.file.path
-            file_integrity: Integrity = plot_obj.file.integrity
-            self.update_file_icon(file_path, file_integrity)
+    def flush_list_items(self) -> None:
+        """Add buffered rows for newly discovered files to `list_loaded_files`."""
+        if not self.pending_list_items:
+            return
+
+        self.list_loaded_files.setUpdatesEnabled(False)
+        for row in self.pending_list_items.values():
+            self.list_loaded_files.addItem(row)
+        self.list_loaded_files.setUpdatesEnabled(True)
+
+        self.pending_list_items.clear()
+
+    @pyqtSlot(object)
+    def add_files_to_models(self, plot_objs: list[PlotObject]) -> None:
+        """Invoke each file's first integrity update and add their paths to the browser model."""
+        for plot_obj in plot_objs:
+            try:
+                file_path: Path = plot_obj.file.path
+                file_integrity: Integrity = plot_obj.file.integrity
+                self.update_file_icon(file_path, file_integrity)
+            except Exception:
+                # No CaptureFile object was created
+                StatusBarWithQueue.post(
+                    "There was a problem reading a file. See the log for details."
+                )
+
+        # Combo models list every loaded file, so they are rebuilt once the whole batch is done
+        if plot_objs and not self.batch_in_progress:
             self.update_combo_models()
-        except Exception:
-            # No CaptureFile object was created
-            StatusBarWithQueue.post("There was a problem reading a file. See the log for details.")
 
     def filter_loaded_files(self, include: bool = True, field: str = "", term: str = "") -> None:
         """Filter the loaded files list by a given field and term."""
-        previous_selection = self.list_loaded_files.selectedItems()
+        field_filters: dict[str, str] = self.file_filter[include]
+        new_term: Optional[str] = term.lower() if term else None
 
-        if term:
-            self.file_filter[include][field] = term.lower()
+        # Edits that don't change the filter (e.g., changing letter case) leave the list as-is
+        if field_filters.get(field) == new_term:
+            return
+
+        # Filtering only ever deselects items (when hiding them), so the selection has changed
+        # exactly when fewer items are selected afterwards
+        previous_selection: int = len(self.list_loaded_files.selectedItems())
+
+        if new_term is None:
+            field_filters.pop(field, None)
         else:
-            self.file_filter[include].pop(field, None)
+            field_filters[field] = new_term
 
         self.list_loaded_files.update_label_filter(self.file_filter)
 
-        changed_selection: bool = previous_selection != self.list_loaded_files.selectedItems()
+        changed_selection: bool = previous_selection != len(self.list_loaded_files.selectedItems())
         if changed_selection and self.list_loaded_files.count() > 0:
             self.refresh_plots()
 
@@ -1816,7 +2040,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.translate_plot_titles()
 
         # Reset named axis labels
-        self.plots["Box"].getAxis("left").setTicks(None)
+        self.plots["Box"].left_axis.setTicks(None)
 
         if drop_tables:
             self.combo_stats_compare_against.setCurrentText("None")
@@ -1837,19 +2061,21 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             else:
                 plot.autoRange()
 
-        for plot_name, pairs in self.plot_range_controls.items():
-            for axis, widgets in pairs.items():
-                self.clamp_range(plot_name, axis, widgets)
+        for plot_name, axis, widgets in self.flat_range_controls:
+            self.clamp_range(plot_name, axis, widgets)
 
     def prescribe_plot_ranges(self) -> None:
         """Force a plot's axis range to start at zero if the clamp checkbox is ticked."""
-        for plot_name, pairs in self.plot_range_controls.items():
-            for widgets in pairs.values():
-                _, _, clamp_widget, _ = widgets
-                if clamp_widget is not None and clamp_widget.isChecked():
-                    self.change_range(plot_name)
+        # Both axes are set by each range change, so plots with two clamped axes change once
+        clamped_plots: dict[str, None] = {
+            plot_name: None
+            for plot_name, _, (_, _, clamp_widget, _) in self.flat_range_controls
+            if clamp_widget is not None and clamp_widget.isChecked()
+        }
+        for plot_name in clamped_plots:
+            self.change_range(plot_name)
 
-        if session("CurrentTabIndex") == Tab.Experience.value:
+        if session("CurrentTabIndex") == _TAB_EXPERIENCE:
             self.pyqtgraph_experience.force_autorange()
 
     def clamp_range(self, plot_name, axis, widgets) -> None:
@@ -1878,7 +2104,12 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             set_range = plot.setXRange if axis == "x" else plot.setYRange
             set_range(min=range_min, max=range_max, padding=0)
 
-    @pyqtSlot()
+    @pyqtSlot(object)
+    def plot_range_changed(self, signal_args: tuple) -> None:
+        """Update the range spinner widgets of the plot that emitted a proxied range signal."""
+        if (plot_name := self.plot_names.get(signal_args[0])) is not None:
+            self.update_plot_ranges(plot_name)
+
     def update_plot_ranges(self, plot_name: str) -> None:
         """Update the spinner widgets associated with a plot's current XY range."""
         min_x, min_y, max_x, max_y = self.plots[plot_name].viewRect().getCoords()
@@ -1898,6 +2129,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             return
 
         viewing_stutter: bool = session("PrimaryDataSource") == "Stutter (%)"
+        show_outliers: bool = session("ShowOutliers")
         self.progressbar_main.setMaximum(len(unplotted_files))
 
         for plot_obj in unplotted_files:
@@ -1922,7 +2154,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 # Box plot includes boxes, error bars, and scatter plots
                 self.add_plot("Box", plot_obj.curves["Box"])
                 self.add_plot("Box", plot_obj.curves["Error"])
-                if session("ShowOutliers"):
+                if show_outliers:
                     self.add_plot("Box", plot_obj.curves["Outliers"])
 
                 if plot_obj.plottable_scatter:
@@ -1938,34 +2170,25 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     @stopwatch(silent=True)
     def warn_of_negative_values(self) -> None:
         """Show or hide caution labels when a plot contains negative data on a clamped axis."""
-        for plot_name in self.plots.keys():
+        for plot_name, axis, (_, _, clamp_widget, label) in self.flat_range_controls:
             # Experience plot uses a different axis format than other plots
-            for axis, widgets in self.plot_range_controls[plot_name].items():
-                _, _, clamp_widget, label = widgets
+            if clamp_widget is None or label is None:
+                continue
 
-                if None in {clamp_widget, label}:
+            negative_value: bool = False
+            if clamp_widget.isChecked():
+                try:
+                    negative_value = any(
+                        _has_negative_values(curve, axis)
+                        for curve in self.plots[plot_name].items()
+                        if isinstance(curve, _RANGE_CURVE_TYPES)
+                    )
+                except TypeError:
                     continue
-
-                negative_value: bool = False
-                if clamp_widget.isChecked():
-                    try:
-                        negative_value = (
-                            sum(
-                                min(curve.xData if axis == "x" else curve.yData) < 0
-                                for curve in self.plots[plot_name].items()
-                                if isinstance(
-                                    curve,
-                                    (PlotDataItem, UnclickableBarGraphItem),
-                                )
-                            )
-                            > 0
-                        )
-                    except TypeError:
-                        break
-                    except Exception as e:
-                        logger.error(f"Non-numeric data in {axis} axis of {plot_name} plot")
-                        log_exception(logger, e)
-                label.setVisible(negative_value)
+                except Exception as e:
+                    logger.error(f"Non-numeric data in {axis} axis of {plot_name} plot")
+                    log_exception(logger, e)
+            label.setVisible(negative_value)
 
     @stopwatch(silent=True)
     def warn_of_custom_values(self) -> None:
@@ -2003,7 +2226,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.recalculate_stutter_stats()
 
         # Only update plots if viewing the stutter data source
-        if "Stutter (%)" in {session("PrimaryDataSource"), session("SecondaryDataSource")}:
+        if "Stutter (%)" in (session("PrimaryDataSource"), session("SecondaryDataSource")):
             self.refresh_plots()
 
     @pyqtSlot(bool)
@@ -2040,16 +2263,24 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     @pyqtSlot()
     def refresh_stats(self) -> None:
         """Refresh the file stats table to account for a new file, modified order, or altered file."""
+        legend_position: dict[PlotObject, int] = {
+            plot_obj: index for index, plot_obj in enumerate(PlotObject.legend_order)
+        }
         selected_files = sorted(
-            self.list_loaded_files.get_selected_items(), key=PlotObject.legend_order.index
+            self.list_loaded_files.get_selected_items(), key=legend_position.__getitem__
         )
-        self.table_stats.reset_view()
+
+        # Rows are added to a detached model, so the view is only reset once all rows are ready
+        model: QStandardItemModel = self.table_stats.empty_model()
+        precision: int = setting_int("General", "DecimalPlaces")
 
         for plot_obj in selected_files:
             plot_obj.calculate_stats()
-            self.add_file_stats(plot_obj.get_all_stats())
+            self.add_file_stats(plot_obj.get_all_stats(), model, precision)
 
-        self.table_stats.resizeColumnsToContents()
+        model.setSortRole(Qt.ItemDataRole.DisplayRole)
+        self.table_stats.setModel(model)
+        self.resize_stats_columns()
 
     @pyqtSlot()
     def update_dragged_line_plot(self) -> None:
@@ -2059,7 +2290,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             * plot_obj (PlotObject, optional): PlotObject instance of the curve being altered. If not
             provided, the currently selected PlotObject is used.
         """
-        PlotObject.get_selected().define_curves("Line")
+        # A trailing throttled call may arrive after the selection was cleared
+        if (selected_plot := PlotObject.get_selected()) is not None:
+            selected_plot.define_curves("Line")
 
     @staticmethod
     def get_box_curves(plot_obj: PlotObject) -> Generator:
@@ -2074,16 +2307,37 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         return (
             curve
             for plot, curve in plot_obj.curves.items()
-            if plot in {"Box", "Error", "Outliers"}
+            if plot in _BOX_PLOT_CURVES
             and plot_obj.plottable_source
             and curve is not None
         )
 
-    def order_box_plots(self, axis_only: bool = False) -> None:
-        """Overwrite x axis values for each box plot and replace axis labels with legend names."""
+    def order_bar_plots(self, axis_only: bool = False) -> None:
+        """Reorder the box and experience plots from a single reversal of the legend order.
+
+        Args:
+            * axis_only (bool, optional): Only relabel the box plot axis. Defaults to False.
+        """
+        reversed_legend: list[PlotObject] = PlotObject.legend_order[::-1]
+        self.order_box_plots(axis_only, reversed_legend)
+        self.order_experience_plots(reversed_legend)
+
+    def order_box_plots(
+        self, axis_only: bool = False, reversed_legend: Optional[list] = None
+    ) -> None:
+        """Overwrite x axis values for each box plot and replace axis labels with legend names.
+
+        Args:
+            * axis_only (bool, optional): Only relabel the axis. Defaults to False.
+            * reversed_legend (list, optional): PlotObjects in reverse legend order. Defaults to
+            None, which reverses the current legend order.
+        """
+        if reversed_legend is None:
+            reversed_legend = PlotObject.legend_order[::-1]
+
         plotted_files: list[PlotObject] = [
             plot_obj
-            for plot_obj in PlotObject.legend_order[::-1]
+            for plot_obj in reversed_legend
             if plot_obj.plotted
             and hasattr(plot_obj, "plottable_source")  # Workaround for LDAT files
             and plot_obj.plottable_source
@@ -2092,77 +2346,104 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         if not plotted_files:
             return
 
-        height: int = int(setting("Box", "Height"))
-        spacing: int = int(setting("Box", "Spacing"))
+        height: int = setting_int("Box", "Height")
+        spacing: int = setting_int("Box", "Spacing")
         intervals: range = range(spacing, (1 + len(plotted_files)) * spacing, spacing)
         legend_names: list = [file.legend_name for file in plotted_files]
         legends_as_ticks: list = [list(zip(intervals, legend_names))]
-        self.plots["Box"].getAxis("left").setTicks(legends_as_ticks)
+        self.plots["Box"].left_axis.setTicks(legends_as_ticks)
 
         if axis_only:
             return
 
+        # Height arrays are shared by every curve that needs resizing
+        bar_heights: list[int] = [height]
+        error_heights: ndarray = repeat(height, 5)
+
+        # Curves are only modified (and repainted) when their height or position has changed
         for index, plot_obj in enumerate(plotted_files):
-            for plot in {"Box", "Error", "Outliers"}:
+            position: int = (1 + index) * spacing
+            for plot in _BOX_PLOT_CURVES:
                 if (curve := plot_obj.curves[plot]) is not None:
                     if hasattr(curve, "height") and curve.opts["height"][0] != height:
                         if isinstance(curve, UnclickableBarGraphItem):
-                            curve.setOpts(height=[height])
+                            curve.setOpts(height=bar_heights)
                         elif isinstance(curve, ClickableErrorBarItem):
-                            curve.setOpts(height=repeat(height, 5))
-                    curve.setY((1 + index) * spacing)
+                            curve.setOpts(height=error_heights)
+                    if curve.y() != position:
+                        curve.setY(position)
 
-    def style_callout_labels(self, value, units: str = "", selected: bool = False) -> str:
-        """Provide HTML styling to value callout labels for the experience plot."""
-        font_size: int = int(setting("Experience", "CalloutTextSize"))
-        precision: int = int(setting("General", "DecimalPlaces"))
+    def callout_span_tags(self) -> dict[bool, str]:
+        """Return the opening HTML tags for experience plot callouts, keyed by file selection."""
+        font_size: int = setting_int("Experience", "CalloutTextSize")
         label_color: tuple = (192, 192, 192) if session("DarkMode") else (0, 0, 0)
-        label_color = label_color + (
-            (int(setting("Plotting", "NormalAlpha")),)
-            if session("SelectedFilePath") == ""
-            else (int(setting("Plotting", "EmphasizedAlpha")),)
-            if selected
-            else (int(setting("Plotting", "DiminishedAlpha")),)
-        )
 
+        alphas: dict[bool, int]
+        if session("SelectedFilePath") == "":
+            alphas = dict.fromkeys((True, False), setting_int("Plotting", "NormalAlpha"))
+        else:
+            alphas = {
+                True: setting_int("Plotting", "EmphasizedAlpha"),
+                False: setting_int("Plotting", "DiminishedAlpha"),
+            }
+
+        return {
+            selected: (
+                f"<span style='font-size:{font_size}pt;"
+                f"font-weight:bold;color:rgba{label_color + (alpha,)};'>"
+            )
+            for selected, alpha in alphas.items()
+        }
+
+    def style_callout_labels(self, value, units: str, span_tags: str, precision: int) -> str:
+        """Provide HTML styling to value callout labels for the experience plot.
+
+        Args:
+            * value (Any): Value or text shown by the callout. Floats are rounded to `precision`.
+            * units (str): Units appended to the value (one of `_CALLOUT_SUFFIXES`), if any.
+            * span_tags (str): Opening tags from `callout_span_tags()` for the file's selection.
+            * precision (int): Number of decimal places shown for float values.
+        """
         if isinstance(value, float):
             value = f"{value:.{precision}f}"
 
-        span_tags: str = (
-            f"<span style='font-size:{font_size}pt;" f"font-weight:bold;color:rgba{label_color};'>"
-        )
-        return f"{span_tags}{value}{f' {units}' if units else ''}</span>"
+        return f"{span_tags}{value}{_CALLOUT_SUFFIXES[units]}</span>"
 
     @stopwatch(silent=True)
     @pyqtSlot()
-    def order_experience_plots(self) -> None:
-        """Draw value callouts for the three points of interest for each experience curve."""
-        experience_plot = self.plots["Experience"]
-        height: int = int(setting("Experience", "Height"))
-        spacing: int = int(setting("Experience", "Spacing"))
+    def order_experience_plots(self, reversed_legend: Optional[list] = None) -> None:
+        """Draw value callouts for the three points of interest for each experience curve.
+
+        Args:
+            * reversed_legend (list, optional): PlotObjects in reverse legend order. Defaults to
+            None, which reverses the current legend order.
+        """
+        if reversed_legend is None:
+            reversed_legend = PlotObject.legend_order[::-1]
+
+        height: int = setting_int("Experience", "Height")
+        spacing: int = setting_int("Experience", "Spacing")
         frameview_files: list[PlotObject] = [
             plot_obj
-            for plot_obj in PlotObject.legend_order[::-1]
+            for plot_obj in reversed_legend
             if plot_obj.plotted
             and plot_obj.file.app_name == "FrameView"
             and plot_obj.file.alias_present("System Latency")
         ]
 
-        # Clear previous text labels
-        existing_labels: Generator = (
-            label for label in experience_plot.items() if isinstance(label, TextItem)
-        )
-        for label_object in existing_labels:
-            experience_plot.removeItem(label_object)
-
         curve: Any = None
         selected: bool = False
-        source_size: int = max(int(setting("Experience", "CalloutTextSize")) - 2, 6)
+        source_size: int = max(setting_int("Experience", "CalloutTextSize") - 2, 6)
         position: int = 0
+        slot: int = 0
+
+        # Callout styles are resolved once for every label drawn during this call
+        span_tags: dict[bool, str] = self.callout_span_tags()
+        precision: int = setting_int("General", "DecimalPlaces")
+        selected_path: str = session("SelectedFilePath")
+        tags: str
 
         label_text: str = ""
-        label_object: TextItem
-        label_value: float = 0.0
         latency = low_fps = avg_fps = 0.0
 
         for index, plot_obj in enumerate(frameview_files):
@@ -2171,10 +2452,12 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 if curve.opts["height"] != height:
                     curve.setOpts(height=height)
 
-                selected = plot_obj.file.path == session("SelectedFilePath")
+                selected = plot_obj.file.path == selected_path
+                tags = span_tags[selected]
                 using_fallback: bool = "System Latency" in plot_obj.file.fallbacks_in_use
                 position = (1 + index) * spacing
-                curve.setY(position)
+                if curve.y() != position:
+                    curve.setY(position)
 
                 latency, low_fps, avg_fps = (
                     curve.opts["x0"][0],  # Negative axis value for latency
@@ -2183,38 +2466,67 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 )
 
                 # Latency label
-                label_value = latency
-                label_text = self.style_callout_labels(-label_value, "ms", selected)
-                label_object = TextItem(html=label_text, anchor=(1.0, 0.5))
-                experience_plot.addItem(label_object)
-                label_object.setPos(label_value, position)
+                label_text = self.style_callout_labels(-latency, "ms", tags, precision)
+                self.place_experience_label(slot, label_text, (1.0, 0.5), latency, position)
 
-                # Legend name and latency header (with fallback marker)
+                # Legend name and latency header (with fallback marker), using latency position
                 label_text = self.style_callout_labels(
                     f"{plot_obj.legend_name}<br>"
                     f"<span style='font-weight:normal;font-size:{source_size}pt;'>"
                     f"{'Fallback: ' if using_fallback else ''}"
                     f"{plot_obj.file.header_by_alias('System Latency')}</span>",
                     "",
-                    selected,
+                    tags,
+                    precision,
                 )
-                label_object = TextItem(html=label_text, anchor=(-0.05, 0.5))
-                experience_plot.addItem(label_object)
-                label_object.setPos(label_value, position)  # Use latency position
+                self.place_experience_label(slot + 1, label_text, (-0.05, 0.5), latency, position)
 
                 # 1st fps percentile label
-                label_value = low_fps
-                label_text = self.style_callout_labels(label_value, "fps", selected)
-                label_object = TextItem(html=label_text, anchor=(1.0, 0.5))
-                experience_plot.addItem(label_object)
-                label_object.setPos(label_value, position)
+                label_text = self.style_callout_labels(low_fps, "fps", tags, precision)
+                self.place_experience_label(slot + 2, label_text, (1.0, 0.5), low_fps, position)
 
                 # Mean fps label
-                label_value = avg_fps
-                label_text = self.style_callout_labels(label_value, "fps", selected)
-                label_object = TextItem(html=label_text, anchor=(-0.05, 0.5))
-                experience_plot.addItem(label_object)
-                label_object.setPos(label_value, position)
+                label_text = self.style_callout_labels(avg_fps, "fps", tags, precision)
+                self.place_experience_label(slot + 3, label_text, (-0.05, 0.5), avg_fps, position)
+
+                slot += 4
+
+        # Hide labels left over from files that are no longer drawn
+        for label_object in self.experience_labels[slot:]:
+            label_object.setVisible(False)
+
+    def place_experience_label(
+        self, slot: int, html: str, anchor: tuple[float, float], x: float, y: float
+    ) -> None:
+        """Show a value callout on the experience plot, reusing the label drawn in the same slot.
+
+        New labels are only created when more callouts are shown than ever before, and the HTML of
+        a reused label is only parsed again when its text has changed.
+
+        Args:
+            * slot (int): Position of the label among every callout drawn on the plot.
+            * html (str): Styled text of the callout.
+            * anchor (tuple[float, float]): Anchor of a new label, which is fixed for each slot.
+            * x (float): Horizontal position of the label.
+            * y (float): Vertical position of the label.
+        """
+        experience_plot = self.plots["Experience"]
+
+        if slot < len(self.experience_labels):
+            label_object: TextItem = self.experience_labels[slot]
+            if label_object.scene() is None:
+                experience_plot.addItem(label_object)  # Removed when the plot was cleared
+            if self.experience_label_html[slot] != html:
+                label_object.setHtml(html)
+                self.experience_label_html[slot] = html
+            label_object.setVisible(True)
+        else:
+            label_object = TextItem(html=html, anchor=anchor)
+            experience_plot.addItem(label_object)
+            self.experience_labels.append(label_object)
+            self.experience_label_html.append(html)
+
+        label_object.setPos(x, y)
 
     @pyqtSlot()
     def update_dropped_line_plot(self) -> None:
@@ -2230,8 +2542,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         PlotObject.update_stutter_metrics(selected_plot)
         self.refresh_stats()
-        self.order_box_plots()
-        self.order_experience_plots()
+        self.order_bar_plots()
 
     @pyqtSlot(int)
     def modify_selected_plot(self) -> None:
@@ -2250,17 +2561,69 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     @pyqtSlot()
     @stopwatch(silent=True)
     def refresh_plots(self) -> None:
-        """Refresh currently plotted items, usually in response to parameter changes."""
-        self.clear_plots(deselect=False, drop_tables=False)
-        self.plot_selected_files()
+        """Refresh currently plotted items, usually in response to parameter changes.
+
+        Curves are updated in place when the same files would be plotted with the same layout.
+        Otherwise, all plots are cleared and the selected files are plotted again.
+        """
+        if not self.update_plotted_curves():
+            self.clear_plots(deselect=False, drop_tables=False)
+            self.plot_selected_files()
         self.list_loaded_files.emphasize_selected_file()
         SquareLegendItem.update_all()
 
+    @stopwatch(silent=True)
+    def update_plotted_curves(self) -> bool:
+        """Overwrite the data of plotted curves instead of removing and re-adding them.
+
+        This is only possible if the selected files are already plotted and the settings that
+        determine which curves appear on each plot are unchanged since the last full replot.
+
+        Returns:
+            * bool: True if the plotted curves were updated, otherwise False.
+        """
+        # Empty data changes which curves are valid and legend labels are only styled when added
+        plot_layout: tuple = (
+            session("PrimaryDataSource"),
+            session("SecondaryDataSource"),
+            session("EnableScatterPlots"),
+            session("ShowOutliers"),
+            setting("Plotting", "PlotEmptyData"),
+            setting("Plotting", "LegendItemFontSize"),
+        )
+        if plot_layout != self.last_plot_layout:
+            self.last_plot_layout = plot_layout
+            return False
+
+        plotted_files: list[PlotObject] = PlotObject.plotted_values()
+        selected_files: set[PlotObject] = set(self.list_loaded_files.get_selected_items())
+        if not plotted_files or selected_files != set(plotted_files):
+            return False
+
+        # Files that become (un)plottable need their curves added to or removed from plots
+        plottable: list[tuple[bool, bool]] = [
+            (plot_obj.plottable_source, plot_obj.plottable_scatter) for plot_obj in plotted_files
+        ]
+        PlotObject.update_all_curves()
+        if plottable != [
+            (plot_obj.plottable_source, plot_obj.plottable_scatter) for plot_obj in plotted_files
+        ]:
+            return False
+
+        self.warn_of_negative_values()
+        self.refresh_stats()
+        self.order_bar_plots()
+
+        self.translate_plot_titles()
+        self.reset_plot_views()
+        self.prescribe_plot_ranges()
+        return True
+
     @pyqtSlot(str)
     def update_primary_source(self, current_text: str = "") -> None:
         """Return a data series corresponding to the x axis selection."""
         # Don't update if the source text has not changed
-        if current_text in {"", session("PrimaryDataSource")}:
+        if current_text in ("", session("PrimaryDataSource")):
             return
 
         viewing_stutter: bool = current_text == "Stutter (%)"
@@ -2290,7 +2653,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     def update_secondary_source(self, current_text: str = "") -> None:
         """Return a data series corresponding to the y axis selection. Only applies to Scatter plot."""
         if (
-            current_text in {"", session("SecondaryDataSource")}
+            current_text in ("", session("SecondaryDataSource"))
             or session("EnableScatterPlots") == "False"
         ):
             return
@@ -2309,6 +2672,12 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         not_viewing_stutter: bool = not (stutter_in_primary or stutter_in_secondary)
         show_scatter_plot: bool = scatter_toggled and not_viewing_stutter
 
+        # Skip relayouts from setting the visibility of widgets that would not change
+        scatter_state: tuple = (scatter_toggled, not_viewing_stutter)
+        if scatter_state == self.last_scatter_state:
+            return show_scatter_plot
+        self.last_scatter_state = scatter_state
+
         self.controls_scatter_toggle.setHidden(scatter_toggled)
         self.plots["Scatter"].setVisible(show_scatter_plot)
         self.controls_scatter.setVisible(show_scatter_plot)
@@ -2382,14 +2751,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.refresh_stats()
 
         # Update bar plots
-        self.order_box_plots()
-        self.order_experience_plots()
+        self.order_bar_plots()
 
         # Update plot views after all items have been added
         self.translate_plot_titles()
         self.reset_plot_views()
         self.prescribe_plot_ranges()
 
+    @pyqtSlot()
     def plot_all_files(self) -> None:
         """Select all items in the file list and run `plot_selected_files()`."""
         self.list_loaded_files.selectAll()
@@ -2405,10 +2774,10 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """Reorder plot legends and redraw bar-based plots."""
         self.order_legend_items()
         self.refresh_stats()
-        self.order_box_plots()
-        self.order_experience_plots()
+        self.order_bar_plots()
         # self.refresh_plots()  # Causes flashing. Not necessary until curves use ordered z-values.
 
+    @pyqtSlot()
     def open_log_folder(self) -> None:
         """Open Windows Explorer at the logging location.
 
@@ -2416,6 +2785,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """
         run([self.native_explorer_path, logging_path()], close_fds=True, shell=False)
 
+    @pyqtSlot()
     def open_output_folder(self) -> None:
         """Open Windows Explorer at the output location.
 
@@ -2424,24 +2794,20 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         run([self.native_explorer_path, output_location()], close_fds=True, shell=False)
 
     @stopwatch(silent=True)
-    def add_file_stats(self, stats: list) -> None:
-        """Insert a file's statistics as a row in the table."""
-        table: SharedEditTableView = self.table_stats
-        model = table.model()
-        item = CustomSortItem
+    def add_file_stats(self, stats: list, model: QStandardItemModel, precision: int) -> None:
+        """Insert a file's statistics as a row in a stats table model.
 
-        row: int = model.rowCount()
-        precision: int = int(setting("General", "DecimalPlaces"))
+        Args:
+            * stats (list): Statistics of the file, ordered by table column.
+            * model (QStandardItemModel): Model receiving the new row.
+            * precision (int): Number of decimal places shown for numeric statistics.
+        """
+        item = CustomSortItem
         converted_items: list = [
             item(v if isinstance(v, str) else f"{v:,.{precision}f}") for v in stats
         ]
 
         model.appendRow(converted_items)
-        model.setSortRole(Qt.ItemDataRole.DisplayRole)
-        table.setModel(model)
-
-        for i, values in enumerate(self.table_headers):
-            model.item(row, i).setTextAlignment(values[0])
 
     def capture_stats_table(self) -> list[list[str]]:
         """Transcribe the immediate contents of the stats table into a list.
@@ -2456,10 +2822,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             [model.horizontalHeaderItem(col).text().replace("\n", " ") for col in columns]
         ]
 
-        data.extend([model.item(row, col).text() for col in columns] for row in rows)
+        # Cells are read from the model rather than a copy made when rows were added, since the
+        # user may have sorted the table or edited file properties since then
+        item: Callable = model.item
+        data.extend([item(row, col).text() for col in columns] for row in rows)
 
         return data
 
+    @pyqtSlot()
     def export_current_view(self) -> None:
         """Export the current tab's view, if supported."""
         tab_index: int = self.view_tabs.currentIndex()
@@ -2530,13 +2900,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         ]
         table_data.append(row_with_index)
 
-        for row in range(rows):
-            row_with_index = [int(data.index[row]) + 1]
-            row_with_index += [str(data.iloc[row, col]) for col in columns]
-            table_data.append(row_with_index)
+        # Convert the frame once and read it row by row, instead of indexing each cell through iloc
+        values: ndarray = data.iloc[:rows].to_numpy(dtype=object)
+        indices: list[int] = (data.index[:rows].to_numpy(dtype=int) + 1).tolist()
+        table_data.extend([index, *map(str, row)] for index, row in zip(indices, values))
 
         write_file_view(table_data)
 
+    @pyqtSlot()
     def choose_stats(self) -> None:
         """Open a dialog for the user to choose what statistics metrics to display."""
         user_saved_changes: bool = self.metrics_dialog.exec()
@@ -2547,25 +2918,33 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     @pyqtSlot()
     @stopwatch(silent=True)
     def update_metric_visibility(self) -> None:
-        """Update stat table headers and save header-widget pairs as encoded JSON."""
+        """Update stat table headers and schedule saving header-widget pairs as encoded JSON."""
         self.header_visibility = self.metrics_dialog.current_selection()
         self.table_stats.update_header_visibility(self.header_visibility)
+        self.persist_metric_visibility(self.header_visibility)
+
+    def save_metric_visibility(self, header_visibility: dict[str, bool]) -> None:
+        """Save header-widget pairs to the config file as encoded JSON.
 
+        Args:
+            * header_visibility (dict[str, bool]): Visibility of each stat table header.
+        """
         # Store config setting as Base64-encoded JSON (dropping binary str prefix)
-        json_obj: str = dumps(self.header_visibility)
+        json_obj: str = dumps(header_visibility)
         compressed_json: str = str(urlsafe_b64encode(json_obj.encode("utf-8")))
         set_value("Statistics", "Visibility", compressed_json[1:])
 
-        if not running_from_exe():
+        if not _FROZEN:
             self.line_dev_encoded_visibility_json.setText(compressed_json)
 
+    @pyqtSlot()
     def update_dynamic_headers(self) -> None:
         """Change dynamic labels in the line plot scale, axis labels, and stat table headers."""
         PlotObject.update_headers()
         SignalingDelegate.update_table_headers()
 
         self.table_stats.set_header_labels()
-        self.table_stats.resizeColumnsToContents()
+        self.resize_stats_columns()
         self.update_line_plot_scale()
         self.recalculate_time_stats()
 
@@ -2622,15 +3001,17 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """Perform rapid resizing of columns for the file browser.
 
         QTableView's resizeColumnsToContents() function considers the widths of every item and is
-        consequently VERY slow when adjusting for data sets of even a few thousand rows. Here we
-        set the table's data model to the file headers and last two rows of data, then resize that.
-        Two rows were chosen so certain formats with irregular structures (e.g., HWiNFO logs) are
-        handled as well. Although not fully accommodating, this method is extremely fast.
+        consequently VERY slow when adjusting for data sets of even a few thousand rows. The file
+        browser's header limits this to the column headers and the first two rows of data (see
+        prepare_models), so the full model can be set once and resized directly. Although not
+        fully accommodating, this method is extremely fast.
         """
-        self.table_file_browser.setModel(DataFrameTableModel(file_data.iloc[-2:]))
-        self.table_file_browser.resizeColumnsToContents()
         self.table_file_browser.setModel(DataFrameTableModel(file_data))
-        self.line_browse_expression.setStyleSheet("")
+        self.table_file_browser.resizeColumnsToContents()
+
+        # Setting any stylesheet repolishes the widget, so only clear an error style
+        if self.line_browse_expression.styleSheet():
+            self.line_browse_expression.setStyleSheet("")
 
     @pyqtSlot(str)
     def compare_against_file(self, base_file: str) -> None:
@@ -2706,51 +3087,53 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             )
 
         file = plot_obj.file
-        initial_properties: dict[str, str] = file.properties
+        initial_properties: dict[str, str] = dict(file.properties)  # Resetting replaces the dict
         initial_pen: tuple = plot_obj.pen
 
-        # Raise dialog box containing file properties and accept changes
-        dialog = FilePropertyDialog(plot_obj)
+        # Raise dialog box containing file properties and accept changes. The dialog is built once
+        # and repopulated afterwards, since constructing its layout dominates the time to open it.
+        if self.properties_dialog is None:
+            self.properties_dialog = FilePropertyDialog(plot_obj)
+        else:
+            self.properties_dialog.load_plot_object(plot_obj)
+        dialog = self.properties_dialog
         running: bool = dialog.exec()
 
         # User canceled or closed window
         if not (running or dialog.changed_values):
             # Undo pen changes
-            plot_obj.pen = initial_pen
-            PlotObject.update_object_pen(plot_obj)
+            if plot_obj.pen != initial_pen:
+                plot_obj.pen = initial_pen
+                PlotObject.update_object_pen(plot_obj)
             return
 
-        # Update pen color and width
-        plot_obj.width = dialog.spin_pen_width.value()  # TODO: Store as metadata
-        PlotObject.update_object_pen(plot_obj)
+        # Pen colors are drawn as they are picked, so curves are only restyled for a new width
+        if (new_width := dialog.spin_pen_width.value()) != plot_obj.width:
+            plot_obj.width = new_width  # TODO: Store as metadata
+            PlotObject.update_object_pen(plot_obj)
 
         # Check for new property data and update PlotObject accordingly
-        updated_properties: dict = {
-            "Application": dialog.line_property_application,
-            "Resolution": dialog.line_property_resolution,
-            "Runtime": dialog.line_property_runtime,
-            "GPU": dialog.line_property_gpu,
-            "Comments": dialog.line_property_comments,
-            "Legend": (
-                dialog.check_use_custom_legend.isChecked(),
-                dialog.line_custom_legend.text(),
-            ),
-        }
-
         changed_value: bool = False
         new_value: str = ""
-        for property, widget in updated_properties.items():
+        for property, widget_name in _PROPERTY_WIDGETS:
             previous_value: str = initial_properties[property]
+            if (new_value := getattr(dialog, widget_name).text()) == previous_value:
+                continue  # Fields the user did not edit
 
-            if property == "Legend":
-                new_value = widget
-            else:
-                new_value = preserve_marks(previous_value, widget.text())
-
+            new_value = preserve_marks(previous_value, new_value)
             if new_value != previous_value:
                 file.properties[property] = new_value
                 changed_value = True
 
+        # Custom legends are stored along with their toggle state, so marks do not apply
+        new_legend: tuple[bool, str] = (
+            dialog.check_use_custom_legend.isChecked(),
+            dialog.line_custom_legend.text(),
+        )
+        if new_legend != initial_properties["Legend"]:
+            file.properties["Legend"] = new_legend
+            changed_value = True
+
         if changed_value:
             update_record(file.hash, file.properties)
             plot_obj.legend_name = dialog.line_custom_legend.text()
@@ -2760,13 +3143,16 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             if not plot_obj.file.uses_saved_properties:
                 plot_obj.file.uses_saved_properties = True
 
+        # Pen changes are already drawn, so only property changes need stats, legends, and titles
+        if file.properties == initial_properties:
+            return
+
         # Update stats, legends, and plot titles
         plot_obj.set_capture_metrics()
         self.update_file_icon(file.path, file.integrity)  # Update tooltips
         self.translate_plot_titles()
         self.refresh_stats()
-        self.order_box_plots()
-        self.order_experience_plots()
+        self.order_bar_plots()
 
     @pyqtSlot(str)
     def view_selected_file(self, target_file: str = "") -> None:
@@ -2792,6 +3178,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         return PlotObject.get_by_path(self.combo_browse_file.currentText())
 
     @stopwatch(silent=True)
+    @pyqtSlot(str)
     def browse_by_header(self, header: str) -> None:
         """Apply column-wise filtering to the current file model."""
         if (viewed := self.viewed_file()) is None:
@@ -2808,12 +3195,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     def warn_of_expression_error(self) -> None:
         """Apply conditional style to the filter expression widget when an evaluation fails."""
         if self.invalid_filter_expression:
-            dark_mode: bool = session("DarkMode")
-            background: str = "#382626" if dark_mode else "#fff0f0"
-            font: str = "#fbeaea" if dark_mode else "#af2121"
-
             self.line_browse_expression.setStyleSheet(
-                f"QLineEdit {{background-color:{background}; border-color:{font}; color:{font};}}"
+                _EXPRESSION_ERROR_STYLES[bool(session("DarkMode"))]
             )
 
     @stopwatch(silent=True)
@@ -2833,8 +3216,28 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             return
 
         try:
+            # Parsing and compiling an expression costs more than selecting its rows, so the row
+            # masks of recent expressions are kept until the browsed data changes
+            data: DataFrame = viewed.file.data
+            data_key: tuple = (viewed.file.path, id(data), viewed.file.data_version)
+            if data_key != self.expression_masks[0]:
+                self.expression_masks = (data_key, {})
+
+            masks: dict[str, Series] = self.expression_masks[1]
+            if (mask := masks.get(expression)) is None:
+                try:
+                    mask = data.eval(expression)
+                except Exception:
+                    # Filter through query instead, which raises if the expression is truly invalid
+                    self.model_and_resize(data.query(expression))
+                    return
+
+                if len(masks) >= _EXPRESSION_MASK_LIMIT:
+                    masks.clear()
+                masks[expression] = mask
+
             # Apply the expression to a variable before committing it to the model
-            filtered_data = viewed.file.data.query(expression)
+            filtered_data = data.loc[mask]
             self.model_and_resize(filtered_data)
         except Exception:
             self.invalid_filter_expression = True
@@ -2848,6 +3251,15 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             * refresh (bool, optional): Whether the percentile plot widget should be refreshed after
             these updates are performed. This should only be set to False during initialization.
         """
+        self.update_percentile_label()
+
+        if refresh and self.plots is not None:
+            PlotObject.update_all_curves("Percentiles")
+            self.plots["Percentiles"].autoRange()
+
+    @pyqtSlot()
+    def update_percentile_label(self) -> None:
+        """Show the number of percentile samples described by the range/step widgets."""
         pct_start: float = self.spin_percentile_start.value()
         pct_end: float = self.spin_percentile_end.value()
         pct_step: float = self.spin_percentile_step.value()
@@ -2856,10 +3268,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             f"Total Samples: {abs(1 + ((pct_end - pct_start) // pct_step)):,.0f}"
         )
 
-        if refresh and hasattr(self, "plots"):
-            PlotObject.update_all_curves("Percentiles")
-            self.plots["Percentiles"].autoRange()
-
+    @pyqtSlot()
     def curve_was_clicked(self) -> None:
         """Function collection related to curve sigClicked events."""
         self.list_loaded_files.emphasize_selected_file()
@@ -1,7 +1,10 @@
 """This module builds a dialog window for modifying capture file properties."""
 
 from base64 import urlsafe_b64decode
+from functools import lru_cache
 from json import loads
+from operator import attrgetter
+from types import MappingProxyType
 
 from core.configuration import set_value, setting
 from core.logger import get_logger, log_exception
@@ -9,10 +12,81 @@ from core.utilities import stat_table_headers
 from gui.layouts.stat_metrics import Ui_Dialog
 from gui.styles import current_stylesheet
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QDialog
+from PyQt6.QtWidgets import QCheckBox, QDialog
 
 logger = get_logger(__name__)
 
+# Checkboxes of each stat table header, in column order. Any modifications to the column headers
+# MUST be copied in the MainWindow instance variable in core.utilities as well as the four
+# categorical methods in PlotObject.
+_METRIC_CHECKBOXES: tuple[str, ...] = (
+    # Capture metadata
+    "check_metric_capture_type",
+    "check_metric_capture_integrity",
+    "check_metric_application",
+    "check_metric_resolution",
+    "check_metric_runtime",
+    "check_metric_gpu",
+    "check_metric_comments",
+    # Display metrics
+    "check_metric_duration",
+    "check_metric_frames",
+    "check_metric_synced_frames",
+    # Performance
+    "check_metric_min_fps",
+    "check_metric_average_fps",
+    "check_metric_median_fps",
+    "check_metric_max_fps",
+    # Performance (percentiles)
+    "check_metric_low_0_1",
+    "check_metric_pct_0_1",
+    "check_metric_low_1",
+    "check_metric_pct_1",
+    "check_metric_pct_5",
+    "check_metric_pct_10",
+    # Relative performance metrics
+    "check_metric_low_0_1_over_avg",
+    "check_metric_pct_0_1_over_avg",
+    "check_metric_low_1_over_avg",
+    "check_metric_pct_1_over_avg",
+    "check_metric_pct_5_over_avg",
+    "check_metric_pct_10_over_avg",
+    # Stutter metrics
+    "check_metric_stutter_number",
+    "check_metric_stutter_proportional",
+    "check_metric_stutter_average",
+    "check_metric_stutter_max",
+    # GPU metrics
+    "check_metric_present_latency",
+    "check_metric_perf_per_watt",
+    "check_metric_gpu_board_power",
+    "check_metric_gpu_chip_power",
+    "check_metric_gpu_frequency",
+    "check_metric_gpu_temperature",
+    "check_metric_gpu_utilization",
+    "check_metric_gpu_voltage",
+    # CPU metrics
+    "check_metric_cpu_power",
+    "check_metric_cpu_frequency",
+    "check_metric_cpu_temperature",
+    "check_metric_cpu_utilization",
+    # Battery metrics
+    "check_metric_battery_charge",
+    "check_metric_battery_life",
+    # Capture metadata (continued)
+    "check_metric_file_name",
+    "check_metric_file_path",
+)
+
+
+@lru_cache(maxsize=4)
+def _decode_visibility(encoded_visibility: str) -> MappingProxyType:
+    """Decode the Base64-encoded JSON of stat table header visibility.
+
+    The result is shared between calls with the same config value, so it is returned read-only.
+    """
+    return MappingProxyType(loads(urlsafe_b64decode(encoded_visibility)))
+
 
 class StatMetricsDialog(QDialog, Ui_Dialog):
     """Builds and updates a PyQt6 GUI."""
@@ -27,85 +101,31 @@ class StatMetricsDialog(QDialog, Ui_Dialog):
             flags | Qt.WindowType.MSWindowsFixedSizeDialogHint | Qt.WindowType.CoverWindow
         )
 
-        self.defaults: dict = loads(
-            urlsafe_b64decode(setting("Statistics", "Visibility", default=True))
+        self.defaults: MappingProxyType = _decode_visibility(
+            setting("Statistics", "Visibility", default=True)
+        )
+        self.headers: tuple[str, ...] = tuple(stat_table_headers())
+
+        self.widgets: tuple[QCheckBox, ...] = attrgetter(*_METRIC_CHECKBOXES)(self)
+        self.header_widgets: tuple[tuple[str, QCheckBox], ...] = tuple(
+            zip(self.headers, self.widgets)
         )
-        self.headers: list = list(stat_table_headers().keys())
-
-        # Any modifications to the column headers MUST be copied in the MainWindow instance
-        # variable in core.utilities as well as the four categorical methods in PlotObject.
-        self.widgets: list = [
-            # Capture metadata
-            self.check_metric_capture_type,
-            self.check_metric_capture_integrity,
-            self.check_metric_application,
-            self.check_metric_resolution,
-            self.check_metric_runtime,
-            self.check_metric_gpu,
-            self.check_metric_comments,
-            # Display metrics
-            self.check_metric_duration,
-            self.check_metric_frames,
-            self.check_metric_synced_frames,
-            # Performance
-            self.check_metric_min_fps,
-            self.check_metric_average_fps,
-            self.check_metric_median_fps,
-            self.check_metric_max_fps,
-            # Performance (percentiles)
-            self.check_metric_low_0_1,
-            self.check_metric_pct_0_1,
-            self.check_metric_low_1,
-            self.check_metric_pct_1,
-            self.check_metric_pct_5,
-            self.check_metric_pct_10,
-            # Relative performance metrics
-            self.check_metric_low_0_1_over_avg,
-            self.check_metric_pct_0_1_over_avg,
-            self.check_metric_low_1_over_avg,
-            self.check_metric_pct_1_over_avg,
-            self.check_metric_pct_5_over_avg,
-            self.check_metric_pct_10_over_avg,
-            # Stutter metrics
-            self.check_metric_stutter_number,
-            self.check_metric_stutter_proportional,
-            self.check_metric_stutter_average,
-            self.check_metric_stutter_max,
-            # GPU metrics
-            self.check_metric_present_latency,
-            self.check_metric_perf_per_watt,
-            self.check_metric_gpu_board_power,
-            self.check_metric_gpu_chip_power,
-            self.check_metric_gpu_frequency,
-            self.check_metric_gpu_temperature,
-            self.check_metric_gpu_utilization,
-            self.check_metric_gpu_voltage,
-            # CPU metrics
-            self.check_metric_cpu_power,
-            self.check_metric_cpu_frequency,
-            self.check_metric_cpu_temperature,
-            self.check_metric_cpu_utilization,
-            # Battery metrics
-            self.check_metric_battery_charge,
-            self.check_metric_battery_life,
-            # Capture metadata (continued)
-            self.check_metric_file_name,
-            self.check_metric_file_path,
-        ]
 
         self.update_selection()
 
     def exec(self) -> int:
         """Execute the dialog and return 0 if user canceled or 1 if they saved changes."""
         self.update_selection()
-        self.setStyleSheet(current_stylesheet())
+
+        # Qt repolishes every child widget when a stylesheet is set, even an identical one
+        if (stylesheet := current_stylesheet()) != self.styleSheet():
+            self.setStyleSheet(stylesheet)
         return super().exec()
 
     def reset_to_defaults(self) -> None:
         """Set all statistics metrics to default."""
-        selections = loads(urlsafe_b64decode(setting("Statistics", "Visibility", default=True)))
-        for widget, visibility in zip(self.widgets, selections.values()):
-            widget.setChecked(bool(visibility))
+        selections = _decode_visibility(setting("Statistics", "Visibility", default=True))
+        self.check_widgets(selections)
 
         self.combo_percentile_method.setCurrentText(
             setting("Statistics", "PercentileMethod", default=True)
@@ -114,13 +134,12 @@ class StatMetricsDialog(QDialog, Ui_Dialog):
     def current_selection(self) -> dict:
         """Return the selection as a dictionary of names and states."""
         set_value("Statistics", "PercentileMethod", self.combo_percentile_method.currentText())
-        return dict(zip(self.headers, [widget.isChecked() for widget in self.widgets]))
+        return {header: widget.isChecked() for header, widget in self.header_widgets}
 
     def update_selection(self) -> None:
         """Match widget states to the user config."""
         try:
-            decoded_selections = urlsafe_b64decode(str.encode(setting("Statistics", "Visibility")))
-            selections = loads(decoded_selections)
+            selections = _decode_visibility(setting("Statistics", "Visibility"))
 
             if self.defaults.keys() != selections.keys():
                 logger.debug("Using default settings for statistics metrics")
@@ -130,5 +149,14 @@ class StatMetricsDialog(QDialog, Ui_Dialog):
             selections = self.defaults
         finally:
             self.combo_percentile_method.setCurrentText(setting("Statistics", "PercentileMethod"))
-            for widget, visibility in zip(self.widgets, selections.values()):
-                widget.setChecked(bool(visibility))
+            self.check_widgets(selections)
+
+    def check_widgets(self, selections: MappingProxyType) -> None:
+        """Check the widget of each metric according to its visibility.
+
+        Args:
+            * selections (MappingProxyType): Visibility of each metric, in the same order as the
+            widgets.
+        """
+        for widget, visibility in zip(self.widgets, selections.values()):
+            widget.setChecked(bool(visibility))
@@ -37,12 +37,13 @@ else:
 
 def record_exists(file_hash: str, section: str) -> bool:
     """Return a bool indicating that a record-section pair exists in the current metadata."""
-    return (
-        not _STORAGE_DISABLED
-        and file_hash in _STORAGE
-        and section in _STORAGE[file_hash]
-        and _STORAGE[file_hash][section]
-    )
+    if _STORAGE_DISABLED:
+        return False
+
+    try:
+        return bool(_STORAGE[file_hash][section])
+    except KeyError:
+        return False
 
 
 def read_record(file_hash: str, section: str = "Properties") -> dict:
@@ -50,9 +51,9 @@ def read_record(file_hash: str, section: str = "Properties") -> dict:
     if not record_exists(file_hash, section):
         return {}
 
-    current_time = int(time())
-    _STORAGE[file_hash]["Record"].update({"Last Accessed": current_time})
-    return _STORAGE[file_hash][section]
+    record: dict = _STORAGE[file_hash]
+    record["Record"]["Last Accessed"] = int(time())
+    return record[section]
 
 
 def update_record(file_hash: str, properties: dict, section: str = "Properties") -> None:
@@ -78,9 +79,10 @@ def update_metadata_file() -> None:
     if _STORAGE_DISABLED or not _STORAGE:
         return remove_all_records()
 
+    # Without indentation, the json module can use its C encoder rather than the Python one
     try:
         with open(_FILE_PATH, "w") as metadata_file:
-            metadata_file.write(dumps(_STORAGE, indent=4, separators=(",", ": ")))
+            metadata_file.write(dumps(_STORAGE, separators=(",", ":")))
     except Exception as e:
         log_exception(logger, e, "Failed to write metadata file")
 
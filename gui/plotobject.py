@@ -1,5 +1,6 @@
 """This module is responsible for creating, tracking, and updating loaded files."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Generator, Optional
 
@@ -55,6 +56,15 @@ from pyqtgraph import PlotDataItem, mkPen
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _percentile_steps(start: float, end: float, step: float) -> ndarray:
+    """Return the percentiles sampled for the percentile plot, which are shared by every curve."""
+    samples: int = int(abs(1 + ((end - start) // step)))
+    steps: ndarray = linspace(start, end, samples)
+    steps.flags.writeable = False
+    return steps
+
+
 def str_to_float(value) -> float:
     """Strip all float-invalid characters from a string."""
     if isinstance(value, (int, float)):
@@ -78,6 +88,7 @@ class PlotObject:
     }
     _instances: dict[str, object] = {}
     _numeric_table_headers: list[str] = numeric_table_headers()
+    _plotted_cache: Optional[list] = None  # Rebuilt on demand after any plotted status changes
     _table_indices = table_indices()
     _valid_instances: dict[str, object] = {}
 
@@ -131,8 +142,13 @@ class PlotObject:
 
     @classmethod
     def plotted_values(cls) -> list:
-        """Return object IDs for valid files from the PlotObject class instance dictionary."""
-        return [v for v in cls._valid_instances.values() if v.plotted]
+        """Return object IDs for valid files from the PlotObject class instance dictionary.
+
+        The list is cached until a file is plotted, unplotted, or added, so it must not be mutated.
+        """
+        if cls._plotted_cache is None:
+            cls._plotted_cache = [v for v in cls._valid_instances.values() if v.plotted]
+        return cls._plotted_cache
 
     @classmethod
     def update_headers(cls) -> None:
@@ -188,6 +204,7 @@ class PlotObject:
         """Reset the PlotObject class instance dictionary."""
         cls._instances = {}
         cls._valid_instances = {}
+        cls._plotted_cache = None
 
         cls.legend_order = []
         cls.reset_selection()
@@ -285,11 +302,12 @@ class PlotObject:
         emphasized: int = int(setting("Plotting", "EmphasizedAlpha"))
         diminished: int = int(setting("Plotting", "DiminishedAlpha"))
 
-        if session("SelectedFilePath") == "":
+        selected_path: str = session("SelectedFilePath")
+        if selected_path == "":
             cls.reset_all_pen_colors()
         else:
             for file_path, plot_obj in cls.valid_objects().items():
-                selected: bool = file_path == session("SelectedFilePath")
+                selected: bool = file_path == selected_path
                 rgb: tuple = plot_obj.pen[:3]
                 plot_obj.pen = rgb + ((emphasized,) if selected else (diminished,))
                 cls.update_object_pen(plot_obj)
@@ -486,6 +504,7 @@ class PlotObject:
 
             # Update the (valid) PlotObject class dict with this instance
             PlotObject._valid_instances[str(self.file.path)] = self
+            PlotObject._plotted_cache = None
             PlotObject.legend_order.append(self)
         except Exception as e:
             log_exception(logger, e, "Failed to create valid PlotObject")
@@ -543,6 +562,7 @@ class PlotObject:
         if is_plotted:
             self.define_curves()
         self._plotted = is_plotted
+        PlotObject._plotted_cache = None
 
     def collect_file_headers(self) -> None:
         """Collect headers from all valid loaded files to make them available as data sources."""
@@ -1090,14 +1110,14 @@ class PlotObject:
     @stopwatch(silent=True)
     def percentile_range(data: ndarray) -> tuple:
         """Calculate percentiles for a given range and interval."""
-        start: float = float(setting("Percentiles", "PercentileStart"))
-        end: float = float(setting("Percentiles", "PercentileEnd"))
-        step: float = float(setting("Percentiles", "PercentileStep"))
-        samples: int = int(abs(1 + ((end - start) // step)))
-        pct_range: ndarray = linspace(start, end, samples)
+        pct_range: ndarray = _percentile_steps(
+            float(setting("Percentiles", "PercentileStart")),
+            float(setting("Percentiles", "PercentileEnd")),
+            float(setting("Percentiles", "PercentileStep")),
+        )
 
         if session("PrimaryDataSource") == "Stutter (%)" or any(isinf(data)):
-            return (pct_range, zeros(samples))
+            return (pct_range, zeros(len(pct_range)))
         return (pct_range, percentile(data, pct_range))
 
     def formatted_legend(self) -> str:
@@ -1206,17 +1226,20 @@ class PlotObject:
             primary_data: ndarray = self.translate_data_source(primary_source)
             self.plottable_source = self.validate_data_source(primary_data, primary_source)
 
-            # Validate secondary data sources for scatter plot
+            # Validate secondary data sources for scatter plot. Other plots only use the primary
+            # data source, so updating one of them leaves the scatter plot state untouched. Any
+            # other target (e.g., "Error") falls through to defining every curve below.
             secondary_source: str = session("SecondaryDataSource")
-            viewing_stutter: bool = "Stutter (%)" in {primary_source, secondary_source}
-            self.plottable_scatter = session("EnableScatterPlots") and not viewing_stutter
             secondary_data = None
 
-            if self.plottable_scatter:
-                if primary_source == secondary_source:
+            if target_plot not in ("Line", "Percentiles", "Histogram", "Box", "Experience"):
+                viewing_stutter: bool = "Stutter (%)" in {primary_source, secondary_source}
+                self.plottable_scatter = session("EnableScatterPlots") and not viewing_stutter
+
+                if self.plottable_scatter and primary_source == secondary_source:
                     secondary_data = primary_data
                     self.plottable_scatter = self.plottable_source
-                else:
+                elif self.plottable_scatter:
                     secondary_data = self.translate_data_source(secondary_source)
                     self.plottable_scatter = self.plottable_source and self.validate_data_source(
                         secondary_data, secondary_source
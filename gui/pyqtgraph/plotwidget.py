@@ -35,6 +35,10 @@ class ContextMenuPlotWidget(PlotWidget):
         if self.name == "Experience":
             self.customize_experience_plot()
 
+        # Keep references to the visible axes, which are restyled often by the main window
+        self.bottom_axis: AxisItem = self.getAxis("bottom")
+        self.left_axis: AxisItem = self.getAxis("left")
+
     def force_autorange(self) -> None:
         """Force the plot to use the autoranging function."""
         self.viewbox.setXRange(0, 1)
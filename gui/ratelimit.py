@@ -0,0 +1,99 @@
+"""This module provides helpers for rate-limiting high-frequency Qt signals.
+
+Unlike pyqtgraph's SignalProxy, these wrappers forward the most recent signal arguments directly to
+the wrapped callable instead of packing them into a tuple, so they can replace a plain slot without
+modifying its signature.
+"""
+
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject, QTimer
+
+
+class ThrottledCallable(QObject):
+    """Invoke a function immediately, then at most once per timeout period.
+
+    Calls made while the timer is active are coalesced into a single trailing call which uses the
+    arguments of the most recent call.
+    """
+
+    def __init__(self, fn: Callable, timeout: int, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._fn: Callable = fn
+        self._args: tuple = ()
+        self._pending: bool = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(timeout)
+        self._timer.timeout.connect(self._flush)
+
+    def __call__(self, *args) -> None:
+        self._args = args
+        if self._timer.isActive():
+            self._pending = True
+            return
+
+        self._fn(*args)
+        self._timer.start()
+
+    def _flush(self) -> None:
+        """Run the trailing call if any were made while the timer was active."""
+        if self._pending:
+            self._pending = False
+            self._fn(*self._args)
+            self._timer.start()
+
+
+class DebouncedCallable(QObject):
+    """Invoke a function once calls have stopped arriving for a full timeout period.
+
+    Each call restarts the timer and replaces the pending arguments, so a burst of calls results
+    in a single call using the arguments of the most recent one.
+    """
+
+    def __init__(self, fn: Callable, timeout: int, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._fn: Callable = fn
+        self._args: tuple = ()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(timeout)
+        self._timer.timeout.connect(self._flush)
+
+    def __call__(self, *args) -> None:
+        self._args = args
+        self._timer.start()
+
+    def _flush(self) -> None:
+        """Run the pending call."""
+        self._fn(*self._args)
+
+    def flush(self) -> None:
+        """Run the pending call immediately instead of waiting for the timer, if one is pending."""
+        if self._timer.isActive():
+            self._timer.stop()
+            self._flush()
+
+
+def qthrottled(fn: Callable, timeout: int = 100, parent: Optional[QObject] = None) -> Callable:
+    """Return a throttled wrapper of a function for connecting to a Qt signal.
+
+    Args:
+        * fn (Callable): Function to be throttled.
+        * timeout (int): Minimum interval between calls (in milliseconds).
+        * parent (QObject, optional): Owner of the wrapper, which keeps it alive with the parent.
+    """
+    return ThrottledCallable(fn, timeout, parent)
+
+
+def qdebounced(fn: Callable, timeout: int = 250, parent: Optional[QObject] = None) -> Callable:
+    """Return a debounced wrapper of a function for connecting to a Qt signal.
+
+    Args:
+        * fn (Callable): Function to be debounced.
+        * timeout (int): Quiet period required before calling the function (in milliseconds).
+        * parent (QObject, optional): Owner of the wrapper, which keeps it alive with the parent.
+    """
+    return DebouncedCallable(fn, timeout, parent)
@@ -1,5 +1,6 @@
 """This module provides stylesheets to multiple modules based on user preference."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from core.configuration import app_root, running_from_exe, session
@@ -23,8 +24,13 @@ _LIGHT_STYLESHEET = as_posix(_LIGHT_STYLESHEET)
 _DARK_STYLESHEET = as_posix(_DARK_STYLESHEET)
 
 
+@lru_cache(maxsize=None)
 def icon_path(icon_name: str) -> QIcon:
-    """Get the path to an icon resource. Required for freezing."""
+    """Get the path to an icon resource. Required for freezing.
+
+    Icons are cached by name so repeated lookups reuse the same QIcon instead of resolving the
+    path and reloading the resource each time.
+    """
     return QIcon(str(_GUI_PATH / "icons" / icon_name))
 
 